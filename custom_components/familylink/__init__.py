@@ -294,97 +294,74 @@ async def async_setup_services(hass: HomeAssistant, coordinator: FamilyLinkDataU
 			_LOGGER.error(f"Failed to unblock all apps: {err}")
 			raise
 
-	async def handle_block_app(call: ServiceCall) -> None:
-		"""Handle block_app service call."""
+	async def _async_set_app_blocked(call: ServiceCall, blocked: bool) -> None:
+		"""Block or unblock an app for one child, or for all of them."""
 		_require_client()
 		package_name = call.data["package_name"]
 		entity_id = call.data.get("entity_id")
 		child_id = call.data.get("child_id")
+		action = "block" if blocked else "unblock"
+		client = coordinator.client
+		set_app_blocked = client.async_block_app if blocked else client.async_unblock_app
 
 		# If entity_id provided, extract child_id from entity attributes
 		if entity_id and not child_id:
 			_, extracted_child_id = extract_ids_from_entity(hass, entity_id)
 			child_id = extracted_child_id
 
+		# Successful changes are applied to the current data so the app
+		# sensors update without a refetch; stays True only if every one
+		# could be applied, otherwise a full refresh is requested below.
+		applied = True
+
 		try:
 			if child_id:
 				# Apply to specific child
-				_LOGGER.info(f"Service called: block_app for {package_name} (child_id: {child_id})")
-				success = await coordinator.client.async_block_app(package_name, account_id=child_id)
+				_LOGGER.info(f"Service called: {action}_app for {package_name} (child_id: {child_id})")
+				success = await set_app_blocked(package_name, account_id=child_id)
 				if success:
-					_LOGGER.info(f"Successfully blocked app: {package_name} for child {child_id}")
+					_LOGGER.info(f"Successfully {action}ed app: {package_name} for child {child_id}")
+					ok = coordinator.apply_app_blocked_state(child_id, package_name, blocked)
+					applied = applied and ok
 				else:
-					_LOGGER.error(f"Failed to block app: {package_name} for child {child_id}")
+					_LOGGER.error(f"Failed to {action} app: {package_name} for child {child_id}")
 			else:
 				# Apply to ALL supervised children
-				_LOGGER.info(f"Service called: block_app for {package_name} (all children)")
-				children = await coordinator.client.async_get_all_supervised_children()
+				_LOGGER.info(f"Service called: {action}_app for {package_name} (all children)")
+				children = await client.async_get_all_supervised_children()
 				success_count = 0
 				fail_count = 0
 
 				for child in children:
 					child_account_id = child["id"]
 					child_name = child["name"]
-					result = await coordinator.client.async_block_app(package_name, account_id=child_account_id)
+					result = await set_app_blocked(package_name, account_id=child_account_id)
 					if result:
 						success_count += 1
-						_LOGGER.info(f"Successfully blocked app: {package_name} for {child_name}")
+						_LOGGER.info(f"Successfully {action}ed app: {package_name} for {child_name}")
+						ok = coordinator.apply_app_blocked_state(child_account_id, package_name, blocked)
+						applied = applied and ok
 					else:
 						fail_count += 1
-						_LOGGER.error(f"Failed to block app: {package_name} for {child_name}")
+						_LOGGER.error(f"Failed to {action} app: {package_name} for {child_name}")
 
-				_LOGGER.info(f"Block app {package_name}: {success_count} succeeded, {fail_count} failed")
+				_LOGGER.info(f"{action.capitalize()} app {package_name}: {success_count} succeeded, {fail_count} failed")
 
-			await coordinator.async_request_refresh()
+			if applied:
+				coordinator.async_set_updated_data(coordinator.data)
+			else:
+				await coordinator.async_request_refresh()
 		except Exception as err:
-			_LOGGER.error(f"Error blocking app {package_name}: {err}")
+			_LOGGER.error(f"Error {action}ing app {package_name}: {err}")
 			raise
 
+	async def handle_block_app(call: ServiceCall) -> None:
+		"""Handle block_app service call."""
+		await _async_set_app_blocked(call, True)
+
 	async def handle_unblock_app(call: ServiceCall) -> None:
 		"""Handle unblock_app service call."""
-		_require_client()
-		package_name = call.data["package_name"]
-		entity_id = call.data.get("entity_id")
-		child_id = call.data.get("child_id")
-
-		# If entity_id provided, extract child_id from entity attributes
-		if entity_id and not child_id:
-			_, extracted_child_id = extract_ids_from_entity(hass, entity_id)
-			child_id = extracted_child_id
-
-		try:
-			if child_id:
-				# Apply to specific child
-				_LOGGER.info(f"Service called: unblock_app for {package_name} (child_id: {child_id})")
-				success = await coordinator.client.async_unblock_app(package_name, account_id=child_id)
-				if success:
-					_LOGGER.info(f"Successfully unblocked app: {package_name} for child {child_id}")
-				else:
-					_LOGGER.error(f"Failed to unblock app: {package_name} for child {child_id}")
-			else:
-				# Apply to ALL supervised children
-				_LOGGER.info(f"Service called: unblock_app for {package_name} (all children)")
-				children = await coordinator.client.async_get_all_supervised_children()
-				success_count = 0
-				fail_count = 0
-
-				for child in children:
-					child_account_id = child["id"]
-					child_name = child["name"]
-					result = await coordinator.client.async_unblock_app(package_name, account_id=child_account_id)
-					if result:
-						success_count += 1
-						_LOGGER.info(f"Successfully unblocked app: {package_name} for {child_name}")
-					else:
-						fail_count += 1
-						_LOGGER.error(f"Failed to unblock app: {package_name} for {child_name}")
-
-				_LOGGER.info(f"Unblock app {package_name}: {success_count} succeeded, {fail_count} failed")
-
-			await coordinator.async_request_refresh()
-		except Exception as err:
-			_LOGGER.error(f"Error unblocking app {package_name}: {err}")
-			raise
+		await _async_set_app_blocked(call, False)
 
 	async def handle_set_app_daily_limit(call: ServiceCall) -> None:
 		"""Handle set_app_daily_limit service call."""
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -53,7 +52,7 @@ async def async_setup_entry(
 		child_id = child_data["child_id"]
 		child_name = child_data["child_name"]
 
-		_LOGGER.debug(f"Creating binary sensors for child: {child_name}")
+		_LOGGER.debug("Creating binary sensors for child: %s", child_name)
 
 		# Ensure parent device (child account) exists in device registry
 		device_registry.async_get_or_create(
@@ -105,8 +104,8 @@ async def async_setup_entry(
 				)
 			)
 
-	_LOGGER.debug(f"Created {len(entities)} binary sensor entities")
-	async_add_entities(entities, update_before_add=True)
+	_LOGGER.debug("Created %d binary sensor entities", len(entities))
+	async_add_entities(entities)
 
 
 class DeviceTimeBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -129,30 +128,22 @@ class DeviceTimeBinarySensor(CoordinatorEntity, BinarySensorEntity):
 		self._device = device
 		self._child_id = child_id
 		self._child_name = child_name
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-			name=self._device_name,
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, f"{child_id}_{device_id}")},
+			name=device_name,
 			manufacturer="Google",
-			model=self._device.get("model", "Family Link Device"),
-			sw_version=self._device.get("version"),
-			via_device=(DOMAIN, self._child_id),
+			model=device.get("model", "Family Link Device"),
+			sw_version=device.get("version"),
+			via_device=(DOMAIN, child_id),
 		)
 
 	def _get_device_time_data(self) -> dict[str, Any] | None:
 		"""Get time data for this specific device."""
-		if not self.coordinator.data or "children_data" not in self.coordinator.data:
+		data = self.coordinator.data
+		if not data:
 			return None
 
-		for child_data in self.coordinator.data["children_data"]:
-			if child_data["child_id"] == self._child_id:
-				devices_time_data = child_data.get("devices_time_data", {})
-				return devices_time_data.get(self._device_id)
-
-		return None
+		return data.get("time_data_by_ids", {}).get((self._child_id, self._device_id))
 
 	@property
 	def available(self) -> bool:
@@ -213,18 +204,10 @@ class BedtimeActiveBinarySensor(DeviceTimeBinarySensor):
 
 		bedtime_window = time_data.get("bedtime_window")
 		if bedtime_window:
-			start_ms = bedtime_window.get("start_ms")
-			end_ms = bedtime_window.get("end_ms")
-			if start_ms:
-				try:
-					attributes["bedtime_start"] = datetime.fromtimestamp(start_ms / 1000).isoformat()
-				except (ValueError, OSError):
-					pass
-			if end_ms:
-				try:
-					attributes["bedtime_end"] = datetime.fromtimestamp(end_ms / 1000).isoformat()
-				except (ValueError, OSError):
-					pass
+			if "start_iso" in bedtime_window:
+				attributes["bedtime_start"] = bedtime_window["start_iso"]
+			if "end_iso" in bedtime_window:
+				attributes["bedtime_end"] = bedtime_window["end_iso"]
 
 		return attributes
 
@@ -279,18 +262,10 @@ class SchoolTimeActiveBinarySensor(DeviceTimeBinarySensor):
 
 		schooltime_window = time_data.get("schooltime_window")
 		if schooltime_window:
-			start_ms = schooltime_window.get("start_ms")
-			end_ms = schooltime_window.get("end_ms")
-			if start_ms:
-				try:
-					attributes["schooltime_start"] = datetime.fromtimestamp(start_ms / 1000).isoformat()
-				except (ValueError, OSError):
-					pass
-			if end_ms:
-				try:
-					attributes["schooltime_end"] = datetime.fromtimestamp(end_ms / 1000).isoformat()
-				except (ValueError, OSError):
-					pass
+			if "start_iso" in schooltime_window:
+				attributes["schooltime_start"] = schooltime_window["start_iso"]
+			if "end_iso" in schooltime_window:
+				attributes["schooltime_end"] = schooltime_window["end_iso"]
 
 		return attributes
 
@@ -46,7 +46,7 @@ async def async_setup_entry(
 		child_id = child_data["child_id"]
 		child_name = child_data["child_name"]
 
-		_LOGGER.debug(f"Creating time bonus buttons for {child_name}'s devices")
+		_LOGGER.debug("Creating time bonus buttons for %s's devices", child_name)
 
 		# Ensure parent device (child account) exists in device registry
 		device_registry.async_get_or_create(
@@ -66,8 +66,8 @@ async def async_setup_entry(
 			# Ring button (make the device sound to help locate it)
 			entities.append(RingDeviceButton(coordinator, device, child_id, child_name))
 
-	_LOGGER.debug(f"Created {len(entities)} time bonus button entities")
-	async_add_entities(entities, update_before_add=True)
+	_LOGGER.debug("Created %d time bonus button entities", len(entities))
+	async_add_entities(entities)
 
 
 class FamilyLinkTimeBonusButton(CoordinatorEntity, ButtonEntity):
@@ -92,13 +92,9 @@ class FamilyLinkTimeBonusButton(CoordinatorEntity, ButtonEntity):
 
 		self._attr_name = f"{device['name']} +{bonus_minutes}min"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_{device['id']}_bonus_{bonus_minutes}min"
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-			name=self._device_name,
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, f"{child_id}_{device['id']}")},
+			name=device["name"],
 			manufacturer="Google",
 			model="Family Link Device",
 		)
@@ -108,11 +104,6 @@ class FamilyLinkTimeBonusButton(CoordinatorEntity, ButtonEntity):
 		"""Return the icon for the button."""
 		return "mdi:clock-plus-outline"
 
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
-
 	async def async_press(self) -> None:
 		"""Handle the button press."""
 		if self.coordinator.client is None:
@@ -160,13 +151,9 @@ class CancelTimeBonusButton(CoordinatorEntity, ButtonEntity):
 
 		self._attr_name = f"{device['name']} Reset Bonus"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_{device['id']}_reset_bonus"
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-			name=self._device_name,
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, f"{child_id}_{device['id']}")},
+			name=device["name"],
 			manufacturer="Google",
 			model="Family Link Device",
 		)
@@ -183,32 +170,22 @@ class CancelTimeBonusButton(CoordinatorEntity, ButtonEntity):
 			return False
 
 		# Only available if there's an active bonus to cancel
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					devices_time_data = child_data.get("devices_time_data", {})
+		time_data = self._get_time_data()
+		return time_data is not None and time_data.get("bonus_override_id") is not None
 
-					if self._device_id in devices_time_data:
-						time_data = devices_time_data[self._device_id]
-						override_id = time_data.get("bonus_override_id")
-						return override_id is not None
+	def _get_time_data(self) -> dict[str, Any] | None:
+		"""Get time data for this specific device."""
+		data = self.coordinator.data
+		if not data:
+			return None
 
-		return False
+		return data.get("time_data_by_ids", {}).get((self._child_id, self._device_id))
 
 	async def async_press(self) -> None:
 		"""Handle the button press - cancel active bonus."""
 		# Get the override_id from coordinator data
-		override_id = None
-
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					devices_time_data = child_data.get("devices_time_data", {})
-
-					if self._device_id in devices_time_data:
-						time_data = devices_time_data[self._device_id]
-						override_id = time_data.get("bonus_override_id")
-						break
+		time_data = self._get_time_data()
+		override_id = time_data.get("bonus_override_id") if time_data else None
 
 		if not override_id:
 			_LOGGER.warning(
@@ -261,13 +238,9 @@ class RingDeviceButton(CoordinatorEntity, ButtonEntity):
 
 		self._attr_name = f"{device['name']} Ring"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_{device['id']}_ring"
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-			name=self._device_name,
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, f"{child_id}_{device['id']}")},
+			name=device["name"],
 			manufacturer="Google",
 			model="Family Link Device",
 		)
@@ -277,11 +250,6 @@ class RingDeviceButton(CoordinatorEntity, ButtonEntity):
 		"""Return the icon for the button."""
 		return "mdi:bell-ring"
 
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
-
 	async def async_press(self) -> None:
 		"""Handle the button press - ring the device."""
 		if self.coordinator.client is None:
@@ -52,6 +52,10 @@ class FamilyLinkClient:
 	# SAPISIDHASH timestamp must stay fresh for Google API authentication
 	SESSION_MAX_AGE = 1800  # 30 minutes
 
+	# Total timeout of a request; also how long a replaced session is kept
+	# open for requests that were already using it
+	REQUEST_TIMEOUT = 30  # seconds
+
 	# LocationRefreshMode enum values for the kidsmanagement location endpoint.
 	# Google changed this field to reject the string names ("REFRESH" /
 	# "DO_NOT_REFRESH") and now only accepts the numeric enum values, so the
@@ -75,6 +79,8 @@ class FamilyLinkClient:
 		self._session: aiohttp.ClientSession | None = None
 		self._session_lock = asyncio.Lock()
 		self._session_created_at: float = 0  # Track session age for SAPISIDHASH refresh
+		# Replaced sessions still open for in-flight requests -> their close task
+		self._retired_sessions: dict[aiohttp.ClientSession, asyncio.Task] = {}
 		self._cookies: list[dict[str, Any]] | None = None
 		self._account_id: str | None = None  # Cached supervised child ID
 		# account_id -> (fetched_at, raw timeLimit response) for weekly slot ids
@@ -233,7 +239,7 @@ class FamilyLinkClient:
 			# Recreate session if SAPISIDHASH timestamp is too old
 			if self._session is not None and (time.time() - self._session_created_at) > self.SESSION_MAX_AGE:
 				_LOGGER.debug("Session SAPISIDHASH is stale (>%ds), recreating session", self.SESSION_MAX_AGE)
-				await self._session.close()
+				self._retire_session(self._session)
 				self._session = None
 
 			if self._session is None:
@@ -312,7 +318,7 @@ class FamilyLinkClient:
 
 				self._session = aiohttp.ClientSession(
 					headers=headers,
-					timeout=aiohttp.ClientTimeout(total=30),
+					timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
 				)
 				self._session_created_at = time.time()
 				_LOGGER.debug("✓ Session created successfully")
@@ -321,6 +327,24 @@ class FamilyLinkClient:
 		finally:
 			self._session_lock.release()
 
+	def _retire_session(self, session: aiohttp.ClientSession) -> None:
+		"""Close a replaced session once requests still using it are done.
+
+		Callers may run concurrently (e.g. the coordinator's per-child
+		fetches), so another coroutine can be mid-request on the session
+		being replaced; it is closed after the request timeout instead.
+		"""
+		async def _async_close_later() -> None:
+			try:
+				await asyncio.sleep(self.REQUEST_TIMEOUT)
+			finally:
+				self._retired_sessions.pop(session, None)
+				await session.close()
+
+		self._retired_sessions[session] = self.hass.async_create_background_task(
+			_async_close_later(), "familylink_close_retired_session"
+		)
+
 	async def async_get_family_members(self) -> dict[str, Any]:
 		"""Get list of all family members.
 
@@ -2807,6 +2831,12 @@ class FamilyLinkClient:
 
 	async def async_cleanup(self) -> None:
 		"""Clean up client resources."""
+		# Close replaced sessions now rather than after their grace period
+		retired = list(self._retired_sessions.values())
+		for task in retired:
+			task.cancel()
+		await asyncio.gather(*retired, return_exceptions=True)
+
 		if self._session:
 			try:
 				await self._session.close()
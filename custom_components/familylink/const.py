@@ -19,6 +19,9 @@ DEFAULT_UPDATE_INTERVAL: Final = 60  # seconds
 DEFAULT_TIMEOUT: Final = 30  # seconds
 DEFAULT_COOKIE_FILE: Final = "familylink_cookies.json"
 
+# Number of per-app usage ranking sensors created per child
+MAX_TOP_APPS: Final = 10
+
 # Family Link URLs
 FAMILYLINK_BASE_URL: Final = "https://families.google.com"
 FAMILYLINK_LOGIN_URL: Final = "https://accounts.google.com/signin"
@@ -35,6 +38,10 @@ COOKIE_EXPIRY_BUFFER: Final = 3600  # 1 hour buffer before expiry
 DEVICE_LOCK_ACTION: Final = "lock"
 DEVICE_UNLOCK_ACTION: Final = "unlock"
 
+# How long a switched time limit shows its requested state before the
+# API data is trusted again
+PENDING_STATE_DURATION: Final = 5.0  # seconds
+
 # Remote action codes (executeRemoteAction endpoint), discovered from the
 # Family Link web UI. Code 2 = ring/find the device (make it sound).
 DEVICE_RING_ACTION_CODE: Final = 2
@@ -4,11 +4,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from datetime import timedelta
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .client.api import FamilyLinkClient
@@ -19,11 +22,145 @@ from .const import (
 	DEVICE_LOCK_ACTION,
 	DOMAIN,
 	LOGGER_NAME,
+	MAX_TOP_APPS,
+	PENDING_STATE_DURATION,
 )
 from .exceptions import FamilyLinkException, SessionExpiredError
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
+# Daily limit warning threshold for the next restriction sensor (minutes)
+DAILY_LIMIT_LOW_MINUTES = 30
+
+# Child data field holding the effective enabled state of each time limit
+_TIME_LIMIT_STATE_KEYS = {
+	"bedtime": "bedtime_enabled_today",
+	"school_time": "school_time_enabled_today",
+	"daily_limit": "daily_limit_enabled",
+}
+
+
+def _classify_next_restriction(time_data: dict[str, Any], now_ms: int) -> tuple[str, int | None]:
+	"""Return (kind, target_ms) for the restriction a device will hit next.
+
+	kind is one of "bedtime_active", "schooltime_active", "bedtime_upcoming",
+	"schooltime_upcoming", "daily_limit_low" or "none". target_ms is the
+	window end (active) or start (upcoming) in epoch milliseconds, else None.
+	"""
+	bedtime_window = time_data.get("bedtime_window") or {}
+	schooltime_window = time_data.get("schooltime_window") or {}
+
+	if time_data.get("bedtime_active") and bedtime_window.get("end_ms"):
+		return "bedtime_active", bedtime_window["end_ms"]
+	if time_data.get("schooltime_active") and schooltime_window.get("end_ms"):
+		return "schooltime_active", schooltime_window["end_ms"]
+
+	start_ms = bedtime_window.get("start_ms")
+	if start_ms and start_ms > now_ms:
+		return "bedtime_upcoming", start_ms
+	start_ms = schooltime_window.get("start_ms")
+	if start_ms and start_ms > now_ms:
+		return "schooltime_upcoming", start_ms
+
+	remaining = time_data.get("remaining_minutes", 0)
+	if time_data.get("daily_limit_enabled") and 0 < remaining <= DAILY_LIMIT_LOW_MINUTES:
+		return "daily_limit_low", None
+
+	return "none", None
+
+
+def _group_apps(apps: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+	"""Split apps by supervision setting in a single pass.
+
+	Returns the "blocked", "with_limits", "always_allowed" and
+	"without_limits" lists exposed by the app sensors. An app can be in
+	several of the first three; "without_limits" holds the rest.
+	"""
+	blocked = []
+	with_limits = []
+	always_allowed = []
+	without_limits = []
+
+	for app in apps:
+		supervision = app.get("supervisionSetting") or {}
+		entry = {
+			"name": app.get("title", "Unknown"),
+			"package": app.get("packageName", ""),
+		}
+		hidden = supervision.get("hidden", False)
+		usage_limit = supervision.get("usageLimit")
+		allowed = supervision.get("alwaysAllowedAppInfo")
+
+		if hidden:
+			blocked.append(entry)
+		if usage_limit:
+			with_limits.append({
+				**entry,
+				"limit_minutes": usage_limit.get("dailyUsageLimitMins", 0),
+				"enabled": usage_limit.get("enabled", False),
+			})
+		if allowed:
+			always_allowed.append(entry)
+		if not (hidden or usage_limit or allowed):
+			without_limits.append(entry)
+
+	return {
+		"blocked": blocked,
+		"with_limits": with_limits,
+		"always_allowed": always_allowed,
+		"without_limits": without_limits,
+	}
+
+
+def _rank_apps(app_breakdown: dict[str, float]) -> list[dict[str, Any]]:
+	"""Return apps ordered by usage (most used first) with formatted durations."""
+	ranked_apps = []
+	for package, seconds in sorted(app_breakdown.items(), key=itemgetter(1), reverse=True):
+		hours, rem = divmod(int(seconds), 3600)
+		mins, secs = divmod(rem, 60)
+		ranked_apps.append({
+			"package": package,
+			"seconds": seconds,
+			"minutes": round(seconds / 60, 1),
+			"formatted": f"{hours:02d}:{mins:02d}:{secs:02d}",
+			"hours": hours,
+			"mins": mins,
+		})
+	return ranked_apps
+
+
+def _copy_time_data(time_data: dict[str, Any]) -> dict[str, Any]:
+	"""Copy a cached device time data entry, including its window dicts."""
+	copied = dict(time_data)
+	for key in ("bedtime_window", "schooltime_window"):
+		if copied.get(key):
+			copied[key] = dict(copied[key])
+	return copied
+
+
+def _add_window_iso(window: dict[str, Any] | None) -> None:
+	"""Store start_iso/end_iso (local time) next to a window's epoch ms bounds."""
+	if not window:
+		return
+
+	for key in ("start", "end"):
+		ms = window.get(f"{key}_ms")
+		if not ms:
+			continue
+		try:
+			window[f"{key}_iso"] = datetime.fromtimestamp(ms / 1000).isoformat()
+		except (ValueError, OSError):
+			pass
+
+
+@dataclass
+class _ChildOp:
+	"""A queued control operation and the future its callers wait on."""
+
+	op: Callable[[], Awaitable[bool]]
+	future: asyncio.Future[bool]
+	key: str | None = None  # ops with the same key replace each other while queued
+
 
 class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 	"""Class to manage fetching data from the Family Link API."""
@@ -37,6 +174,11 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 		self._auth_notification_sent = False  # Only send auth notification once
 		self._pending_lock_states: dict[str, tuple[bool, float]] = {}  # device_id -> (locked, timestamp)
 		self._pending_time_limit_states: dict[str, dict[str, tuple[bool, float]]] = {}  # child_id -> {"bedtime": (enabled, timestamp), "school_time": (enabled, timestamp), "daily_limit": (enabled, timestamp)}
+		# Per-child queue of control operations, drained by one worker at a time
+		self._child_queues: dict[str, asyncio.Queue[_ChildOp]] = {}
+		self._child_workers: dict[str, asyncio.Task] = {}
+		# Keyed operations that are queued but not started yet
+		self._queued_child_ops: dict[tuple[str, str], _ChildOp] = {}
 		self._last_known_data: dict[str, Any] | None = None  # Cache for last successful fetch
 
 		# Get settings from options (runtime changes) or fall back to data (initial config)
@@ -54,6 +196,8 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 			_LOGGER,
 			name=DOMAIN,
 			update_interval=timedelta(seconds=update_interval),
+			# Skip listener callbacks when a poll returns the same payload
+			always_update=False,
 		)
 		_LOGGER.debug(f"Coordinator initialized with update_interval={update_interval}s, location_tracking={self._location_tracking_enabled}")
 
@@ -155,10 +299,21 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 			_LOGGER.debug(f"Fetching data for child: {child_name} (ID: {child_id})")
 
 			# Fetch complete apps and usage data for this child
+			# The three per-child endpoints are independent, so fetch them
+			# concurrently; each result is handled (or recovered) below.
+			apps_usage_result, time_limit_result, applied_limits_result = await asyncio.gather(
+				self.client.async_get_apps_and_usage(account_id=child_id),
+				self.client.async_get_time_limit(account_id=child_id),
+				self.client.async_get_applied_time_limits(account_id=child_id),
+				return_exceptions=True,
+			)
+
 			apps_usage_data = None
 			cached_devices = None  # Populated from cache only if the fetch fails
 			try:
-				apps_usage_data = await self.client.async_get_apps_and_usage(account_id=child_id)
+				if isinstance(apps_usage_result, BaseException):
+					raise apps_usage_result
+				apps_usage_data = apps_usage_result
 				_LOGGER.debug(
 					f"Fetched for {child_name}: {len(apps_usage_data.get('apps', []))} apps, "
 					f"{len(apps_usage_data.get('deviceInfo', []))} devices, "
@@ -222,7 +377,9 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 			bedtime_enabled_today_from_rules = None
 
 			try:
-				time_limit_config = await self.client.async_get_time_limit(account_id=child_id)
+				if isinstance(time_limit_result, BaseException):
+					raise time_limit_result
+				time_limit_config = time_limit_result
 				bedtime_enabled = time_limit_config.get("bedtime_enabled")
 				school_time_enabled = time_limit_config.get("school_time_enabled")
 				bedtime_enabled_today_from_rules = time_limit_config.get("bedtime_enabled_today")
@@ -260,7 +417,9 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 			schooltime_enabled_today = None
 
 			try:
-				applied_limits_data = await self.client.async_get_applied_time_limits(account_id=child_id)
+				if isinstance(applied_limits_result, BaseException):
+					raise applied_limits_result
+				applied_limits_data = applied_limits_result
 				device_lock_states = applied_limits_data.get("device_lock_states", {})
 				devices_time_data = applied_limits_data.get("devices", {})
 				bedtime_enabled_today = applied_limits_data.get("bedtime_enabled_today")
@@ -279,7 +438,13 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 				if self._last_known_data:
 					for cached_child in self._last_known_data.get("children_data", []):
 						if cached_child.get("child_id") == child_id:
-							devices_time_data = cached_child.get("devices_time_data", {})
+							# Copy: the cached entries are still part of self.data, and
+							# enriching them in place below would change the previous
+							# payload as well, hiding the update from always_update=False
+							devices_time_data = {
+								device_id: _copy_time_data(time_data)
+								for device_id, time_data in cached_child.get("devices_time_data", {}).items()
+							}
 							bedtime_enabled_today = cached_child.get("bedtime_enabled_today")
 							schooltime_enabled_today = cached_child.get("school_time_enabled_today")
 							_LOGGER.debug(f"Using cached applied time limits for {child_name}")
@@ -293,6 +458,21 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 			if bedtime_enabled_today_from_rules is not None:
 				bedtime_enabled_today = bedtime_enabled_today_from_rules
 
+			# Derive per-device values once per refresh, so the device
+			# sensors only have to read (or format) them.
+			now_ms = time.time_ns() // 1_000_000
+			for time_data in devices_time_data.values():
+				kind, target_ms = _classify_next_restriction(time_data, now_ms)
+				time_data["next_restriction_kind"] = kind
+				time_data["next_restriction_target_ms"] = target_ms
+
+				total = time_data.get("total_allowed_minutes", 0)
+				used = time_data.get("used_minutes", 0)
+				time_data["percentage_used"] = round((used / total) * 100, 1) if total > 0 else 0
+
+				_add_window_iso(time_data.get("bedtime_window"))
+				_add_window_iso(time_data.get("schooltime_window"))
+
 			# Update device cache with real lock states from API
 			current_time = time.time()
 			for device in devices:
@@ -363,9 +543,26 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 						if cached_child.get("child_id") == child_id:
 							screen_time = cached_child.get("screen_time")
 							if screen_time:
+								screen_time = dict(screen_time)  # enriched below; see devices_time_data
 								_LOGGER.debug(f"Using cached screen time for {child_name}")
 							break
 
+			# Rank and format apps by usage once per refresh. The daily screen
+			# time sensor lists all of them, the top-app sensors the first few.
+			if screen_time:
+				sorted_apps = _rank_apps(screen_time.get("app_breakdown", {}))
+				screen_time["sorted_apps"] = sorted_apps
+				# The API reports the day the totals belong to; fall back to today
+				report_date = screen_time.get("date")
+				if report_date is None:
+					report_date = datetime.now().date()
+				screen_time["date_str"] = str(report_date)
+				screen_time["top_apps"] = sorted_apps[:MAX_TOP_APPS]
+
+			# Index this child's devices by id for O(1) lookups (location
+			# source device below, per-device entities)
+			devices_by_id = {device["id"]: device for device in devices}
+
 			# Fetch location data for this child (if enabled)
 			location = None
 			if self._location_tracking_enabled:
@@ -374,13 +571,8 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 					if location:
 						# Resolve source device name from device ID
 						source_device_id = location.get("source_device_id")
-						source_device_name = None
-						if source_device_id:
-							for device in devices:
-								if device.get("id") == source_device_id:
-									source_device_name = device.get("name")
-									break
-						location["source_device_name"] = source_device_name
+						source_device = devices_by_id.get(source_device_id) if source_device_id else None
+						location["source_device_name"] = source_device.get("name") if source_device else None
 						_LOGGER.debug(
 							f"Fetched location for {child_name}: "
 							f"({location['latitude']}, {location['longitude']}) "
@@ -391,15 +583,35 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 				except Exception as err:
 					_LOGGER.warning(f"Failed to fetch location data for {child_name}: {err}")
 
+			apps = apps_usage_data.get("apps", []) if apps_usage_data else []
+
 			# Store data for this child
 			child_data = {
 				"child": child,
 				"child_id": child_id,
 				"child_name": child_name,
 				"devices": devices,
+				"devices_by_id": devices_by_id,
+				# Summary exposed by the device count sensor, built once per
+				# refresh rather than on every attribute read.
+				"device_list": [
+					{
+						"name": device.get("name", "Unknown"),
+						"model": device.get("model", "Unknown"),
+						"id": device.get("id", ""),
+					}
+					for device in devices
+				],
 				"screen_time": screen_time,
 				"location": location,
-				"apps": apps_usage_data.get("apps", []) if apps_usage_data else [],
+				"apps": apps,
+				"app_groups": _group_apps(apps),
+				# packageName -> display title for the app usage sensors
+				"app_titles": {
+					app["packageName"]: app.get("title", app["packageName"])
+					for app in apps
+					if app.get("packageName")
+				},
 				"app_usage_sessions": apps_usage_data.get("appUsageSessions", []) if apps_usage_data else [],
 				"bedtime_enabled": bedtime_enabled,
 				"school_time_enabled": school_time_enabled,
@@ -425,6 +637,13 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 			"family_members": family_members,
 			"supervised_children": supervised_children,
 			"children_data": children_data,
+			# O(1) lookup for entities, built once per refresh
+			"children_by_id": {child_data["child_id"]: child_data for child_data in children_data},
+			"time_data_by_ids": {
+				(child_data["child_id"], device_id): time_data
+				for child_data in children_data
+				for device_id, time_data in child_data.get("devices_time_data", {}).items()
+			},
 		}
 
 	async def _async_setup_client(self) -> None:
@@ -517,7 +736,7 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 				None clears any pending state (e.g. after a failed API call).
 		"""
 		if enabled is None:
-			self._pending_time_limit_states.get(child_id, {}).pop(limit_type, None)
+			self._discard_pending_time_limit_state(child_id, limit_type)
 			_LOGGER.debug(f"Cleared pending {limit_type} state for child {child_id}")
 			return
 
@@ -537,22 +756,143 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 		Returns:
 			The pending enabled state if valid, None otherwise
 		"""
-		if child_id not in self._pending_time_limit_states:
+		# Fast path: nothing is pending for this child (the common case)
+		pending = self._pending_time_limit_states.get(child_id)
+		if not pending or limit_type not in pending:
 			return None
 
-		if limit_type not in self._pending_time_limit_states[child_id]:
-			return None
-
-		enabled, timestamp = self._pending_time_limit_states[child_id][limit_type]
+		enabled, timestamp = pending[limit_type]
 		age = time.time() - timestamp
 
-		if age < 5.0:  # Pending state valid for 5 seconds
+		if age < PENDING_STATE_DURATION:
 			return enabled
 		else:
 			# Expired, clean up
-			del self._pending_time_limit_states[child_id][limit_type]
+			self._discard_pending_time_limit_state(child_id, limit_type)
 			return None
 
+	def _discard_pending_time_limit_state(self, child_id: str, limit_type: str) -> None:
+		"""Drop a pending state, and the child's entry once nothing is left."""
+		pending = self._pending_time_limit_states.get(child_id)
+		if pending is None:
+			return
+		pending.pop(limit_type, None)
+		if not pending:
+			del self._pending_time_limit_states[child_id]
+
+	@callback
+	def async_enqueue_child_op(
+		self, child_id: str, op: Callable[[], Awaitable[bool]], key: str | None = None
+	) -> asyncio.Future[bool]:
+		"""Queue a control operation for a child.
+
+		Operations for the same child run one after another. Each returns
+		True if it already brought the current data up to date (or changed
+		nothing); listeners are then notified once after the last queued
+		operation, and a refresh is only requested if one of them returned
+		False or raised.
+
+		If an operation with the same key is still waiting in the queue,
+		it is replaced by this one, so rapid toggles of one switch send only
+		the latest state; both callers then wait on the same future.
+
+		Returns a future with the operation's result (or exception), so the
+		caller can wait for its own API call to complete.
+		"""
+		if key is not None:
+			queued = self._queued_child_ops.get((child_id, key))
+			if queued is not None:
+				queued.op = op
+				return queued.future
+
+		entry = _ChildOp(op, self.hass.loop.create_future(), key)
+		if key is not None:
+			self._queued_child_ops[(child_id, key)] = entry
+		queue = self._child_queues.setdefault(child_id, asyncio.Queue())
+		queue.put_nowait(entry)
+		if child_id not in self._child_workers:
+			self._child_workers[child_id] = self.hass.async_create_task(
+				self._async_drain_child_queue(child_id)
+			)
+		return entry.future
+
+	async def _async_drain_child_queue(self, child_id: str) -> None:
+		"""Run queued operations for a child, then update listeners once."""
+		queue = self._child_queues[child_id]
+		up_to_date = True
+		try:
+			while not queue.empty():
+				entry = queue.get_nowait()
+				future = entry.future
+				if entry.key is not None:
+					# Started: later requests queue a new operation
+					del self._queued_child_ops[(child_id, entry.key)]
+				try:
+					result = await entry.op()
+				except asyncio.CancelledError:
+					future.cancel()
+					raise
+				except Exception as err:  # noqa: BLE001 - keep draining the queue
+					# Surfaced to the caller awaiting the future
+					up_to_date = False
+					if not future.done():
+						future.set_exception(err)
+					continue
+				up_to_date = result and up_to_date
+				if not future.done():
+					future.set_result(result)
+		finally:
+			del self._child_workers[child_id]
+
+		if up_to_date and self.data:
+			self.async_set_updated_data(self.data)
+		else:
+			await self.async_request_refresh()
+
+	def apply_app_blocked_state(self, child_id: str, package_name: str, blocked: bool) -> bool:
+		"""Update an app's blocked flag in the current data without refetching.
+
+		Used after a successful block/unblock call so the app sensors reflect
+		the change immediately; the next scheduled poll reconciles anything
+		else the API changed. Returns False if the app is not in the current
+		data, in which case the caller should request a refresh instead.
+		"""
+		if not self.data:
+			return False
+
+		child_data = self.data.get("children_by_id", {}).get(child_id)
+		if child_data is None:
+			return False
+
+		for app in child_data.get("apps", []):
+			if app.get("packageName") == package_name:
+				app["supervisionSetting"] = {**(app.get("supervisionSetting") or {}), "hidden": blocked}
+				child_data["app_groups"] = _group_apps(child_data["apps"])
+				return True
+
+		return False
+
+	def apply_time_limit_state(self, child_id: str, limit_type: str, enabled: bool) -> bool:
+		"""Update a time limit's enabled state in the current data without refetching.
+
+		Used after a successful enable/disable call; the next scheduled poll
+		reconciles anything else the API changed. Returns False if the child
+		is not in the current data, or if other data depends on the change
+		and a refresh is needed.
+		"""
+		if not self.data:
+			return False
+
+		child_data = self.data.get("children_by_id", {}).get(child_id)
+		if child_data is None:
+			return False
+
+		child_data[_TIME_LIMIT_STATE_KEYS[limit_type]] = enabled
+		# The daily limit is also carried per device (devices_time_data and
+		# the device entries read by the device sensors), with remaining
+		# times only the API can recompute; refresh rather than patch them.
+		return limit_type != "daily_limit"
+
 	async def async_get_device(self, device_id: str) -> dict[str, Any] | None:
 		"""Get device data by ID."""
 		return self._devices.get(device_id)
@@ -584,6 +924,17 @@ class FamilyLinkDataUpdateCoordinator(DataUpdateCoordinator):
 
 	async def async_cleanup(self) -> None:
 		"""Clean up coordinator resources."""
+		# Stop queued control operations before the client goes away
+		workers = list(self._child_workers.values())
+		for worker in workers:
+			worker.cancel()
+		await asyncio.gather(*workers, return_exceptions=True)
+		for queue in self._child_queues.values():
+			while not queue.empty():
+				queue.get_nowait().future.cancel()
+		self._child_queues.clear()
+		self._queued_child_ops.clear()
+
 		if self.client is not None:
 			await self.client.async_cleanup()
 			self.client = None
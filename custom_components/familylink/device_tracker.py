@@ -53,7 +53,7 @@ async def async_setup_entry(
 				child_name=child_name,
 			)
 		)
-		_LOGGER.debug(f"Created device tracker for child: {child_name}")
+		_LOGGER.debug("Created device tracker for child: %s", child_name)
 
 	if entities:
 		async_add_entities(entities)
@@ -79,27 +79,20 @@ class FamilyLinkDeviceTracker(CoordinatorEntity[FamilyLinkDataUpdateCoordinator]
 		# Result: device_tracker.child_name_family_link
 		self._attr_name = None
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_location"
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, child_id)},
+			name=f"{child_name} (Family Link)",
+			manufacturer="Google",
+			model="Family Link Account",
+		)
 
 	def _get_child_data(self) -> dict[str, Any] | None:
 		"""Get data for this specific child."""
-		if not self.coordinator.data or "children_data" not in self.coordinator.data:
+		data = self.coordinator.data
+		if not data:
 			return None
 
-		for child_data in self.coordinator.data["children_data"]:
-			if child_data["child_id"] == self._child_id:
-				return child_data
-
-		return None
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information for this child."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, self._child_id)},
-			name=f"{self._child_name} (Family Link)",
-			manufacturer="Google",
-			model="Family Link Account",
-		)
+		return data.get("children_by_id", {}).get(self._child_id)
 
 	@property
 	def source_type(self) -> SourceType:
@@ -19,6 +19,7 @@ where picking the wrong rule's id would corrupt the schedule).
 """
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -162,7 +163,7 @@ def parse_window_schedule_items(items: Any, code_prefix: str) -> list[dict[str,
 			"state_flag": state_flag,
 		})
 
-	return sorted(schedules, key=lambda slot: slot["day"])
+	return sorted(schedules, key=itemgetter("day"))
 
 
 def _walk_lists(value: Any):
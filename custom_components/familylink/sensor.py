@@ -1,9 +1,11 @@
 """Sensor platform for Google Family Link integration."""
 from __future__ import annotations
 
-from datetime import datetime
 import json
 import logging
+import time
+from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,16 +15,21 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_ENABLE_LOCATION_TRACKING, DOMAIN, LOGGER_NAME
-from .coordinator import FamilyLinkDataUpdateCoordinator
+from .const import CONF_ENABLE_LOCATION_TRACKING, DOMAIN, LOGGER_NAME, MAX_TOP_APPS
+from .coordinator import FamilyLinkDataUpdateCoordinator, _classify_next_restriction
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
+# Shared read-only fallback for missing nested dicts (avoids allocating a
+# fresh `{}` default on every lookup)
+_EMPTY: MappingProxyType = MappingProxyType({})
+
 
 class ChildDataMixin:
     """Mixin to provide child-specific data access."""
@@ -31,28 +38,79 @@ class ChildDataMixin:
         """Initialize with child information."""
         self._child_id = child_id
         self._child_name = child_name
+        # Last lookup result and the coordinator payload it was taken from.
+        # The coordinator replaces `data` wholesale on every refresh, so an
+        # identity check is enough to know when the cached lookup is stale.
+        self._child_data_source: dict[str, Any] | None = None
+        self._child_data_cache: dict[str, Any] | None = None
+        # Same idea for the app list attributes: the coordinator builds new
+        # app lists on every refresh, so the list identity keys the cache.
+        self._app_list_source: list[dict] | None = None
+        self._app_list_attrs: dict[str, Any] = {}
         super().__init__(*args, **kwargs)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, child_id)},
+            name=f"{child_name} (Family Link)",
+            manufacturer="Google",
+            model="Family Link Account",
+        )
 
     def _get_child_data(self) -> dict[str, Any] | None:
-        """Get data for this specific child."""
-        if not self.coordinator.data or "children_data" not in self.coordinator.data:
+        """Get data for this specific child (memoized per coordinator update)."""
+        data = self.coordinator.data
+        if data is not None and data is self._child_data_source:
+            return self._child_data_cache
+
+        child_data = self._lookup_child_data(data)
+        self._child_data_source = data
+        self._child_data_cache = child_data
+        return child_data
+
+    def _lookup_child_data(self, data: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Find this child's entry in a coordinator payload."""
+        if not data:
             return None
 
-        for child_data in self.coordinator.data["children_data"]:
-            if child_data["child_id"] == self._child_id:
-                return child_data
-
-        return None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this child."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._child_id)},
-            name=f"{self._child_name} (Family Link)",
-            manufacturer="Google",
-            model="Family Link Account",
-        )
+        return data.get("children_by_id", _EMPTY).get(self._child_id)
+
+    def _app_list_attributes(self, apps: list[dict]) -> dict[str, Any]:
+        """Return count/apps attributes for an app list, truncated to fit HA's limit."""
+        if apps is not self._app_list_source:
+            base_attrs = {
+                "child_id": self._child_id,
+                "child_name": self._child_name,
+                "count": len(apps),
+            }
+            truncated_apps, was_truncated = _truncate_app_list(apps, base_attrs)
+            base_attrs["apps"] = truncated_apps
+            if was_truncated:
+                base_attrs["truncated"] = True
+            self._app_list_source = apps
+            self._app_list_attrs = base_attrs
+        return self._app_list_attrs
+
+    def _refresh_state(self) -> None:
+        """Recompute the cached state and attributes from coordinator data."""
+        self._attr_native_value = self._compute_native_value()
+        self._attr_extra_state_attributes = self._compute_attributes()
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state before the entity is first written."""
+        await super().async_added_to_hass()
+        self._refresh_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild state once per coordinator update instead of on every read."""
+        self._refresh_state()
+        super()._handle_coordinator_update()
+
+    def _has_key(self, key: str) -> bool:
+        """Return True if the last update succeeded and this child has `key` set."""
+        if not self.coordinator.last_update_success:
+            return False
+        child_data = self._get_child_data()
+        return child_data is not None and child_data.get(key) is not None
 
 
 async def async_setup_entry(
@@ -63,8 +121,6 @@ async def async_setup_entry(
     """Set up Family Link sensor entities from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-
     # Check if data is available (should be after async_config_entry_first_refresh)
     if not coordinator.data or "children_data" not in coordinator.data:
         _LOGGER.error(
@@ -75,49 +131,121 @@ async def async_setup_entry(
         )
         return
 
-    # Create sensor entities for each child and their devices
-    for child_data in coordinator.data.get("children_data", []):
-        child_id = child_data["child_id"]
-        child_name = child_data["child_name"]
+    location_enabled = entry.options.get(
+        CONF_ENABLE_LOCATION_TRACKING,
+        entry.data.get(CONF_ENABLE_LOCATION_TRACKING, False),
+    )
+
+    def _iter_entities():
+        """Yield sensor entities for each child and their devices."""
+        for child_data in coordinator.data.get("children_data", []):
+            child_id = child_data["child_id"]
+            child_name = child_data["child_name"]
 
-        _LOGGER.debug(f"Creating sensors for {child_name}")
+            _LOGGER.debug("Creating sensors for %s", child_name)
 
-        # Original sensors (apps, screen time, etc.)
-        entities.append(FamilyLinkScreenTimeSensor(coordinator, "total", child_id, child_name))
-        entities.append(FamilyLinkScreenTimeFormattedSensor(coordinator, child_id, child_name))
-        entities.append(FamilyLinkAppCountSensor(coordinator, child_id, child_name))
-        entities.append(FamilyLinkBlockedAppsSensor(coordinator, child_id, child_name))
-        entities.append(FamilyLinkAppsWithLimitsSensor(coordinator, child_id, child_name))
-        entities.append(FamilyLinkAppsWithoutLimitsSensor(coordinator, child_id, child_name))
-        entities.append(FamilyLinkAlwaysAllowedAppsSensor(coordinator, child_id, child_name))
+            # Original sensors (apps, screen time, etc.)
+            yield FamilyLinkScreenTimeSensor(coordinator, "total", child_id, child_name)
+            yield FamilyLinkScreenTimeFormattedSensor(coordinator, child_id, child_name)
+            yield FamilyLinkAppCountSensor(coordinator, child_id, child_name)
+            yield FamilyLinkBlockedAppsSensor(coordinator, child_id, child_name)
+            yield FamilyLinkAppsWithLimitsSensor(coordinator, child_id, child_name)
+            yield FamilyLinkAppsWithoutLimitsSensor(coordinator, child_id, child_name)
+            yield FamilyLinkAlwaysAllowedAppsSensor(coordinator, child_id, child_name)
 
-        # Top apps sensors (top 10)
-        for i in range(1, 11):
-            entities.append(FamilyLinkTopAppSensor(coordinator, i, child_id, child_name))
+            # Top apps sensors (top 10)
+            for i in range(1, MAX_TOP_APPS + 1):
+                yield FamilyLinkTopAppSensor(coordinator, i, child_id, child_name)
 
-        # Device sensors
-        entities.append(FamilyLinkDeviceCountSensor(coordinator, child_id, child_name))
-        entities.append(FamilyLinkChildInfoSensor(coordinator, child_id, child_name))
+            # Device sensors
+            yield FamilyLinkDeviceCountSensor(coordinator, child_id, child_name)
+            yield FamilyLinkChildInfoSensor(coordinator, child_id, child_name)
 
-        # Battery sensor (only if location tracking is enabled, as battery comes from location data)
-        if entry.options.get(CONF_ENABLE_LOCATION_TRACKING, entry.data.get(CONF_ENABLE_LOCATION_TRACKING, False)):
-            entities.append(FamilyLinkBatteryLevelSensor(coordinator, child_id, child_name))
+            # Battery sensor (only if location tracking is enabled, as battery comes from location data)
+            if location_enabled:
+                yield FamilyLinkBatteryLevelSensor(coordinator, child_id, child_name)
 
-        # Create device sensors for each device (4 sensors per device)
-        for device in child_data.get("devices", []):
-            device_id = device["id"]
-            device_name = device.get("name", "Unknown Device")
+            # Create device sensors for each device (4 sensors per device)
+            for device in child_data.get("devices", []):
+                device_id = device["id"]
+                device_name = device.get("name", "Unknown Device")
 
-            entities.append(ScreenTimeRemainingSensor(coordinator, child_id, child_name, device_id, device_name))
-            entities.append(NextRestrictionSensor(coordinator, child_id, child_name, device_id, device_name))
-            entities.append(DailyLimitDeviceSensor(coordinator, child_id, child_name, device_id, device_name))
-            entities.append(ActiveBonusSensor(coordinator, child_id, child_name, device_id, device_name))
+                yield ScreenTimeRemainingSensor(coordinator, child_id, child_name, device_id, device_name)
+                yield NextRestrictionSensor(coordinator, child_id, child_name, device_id, device_name)
+                yield DailyLimitDeviceSensor(coordinator, child_id, child_name, device_id, device_name)
+                yield ActiveBonusSensor(coordinator, child_id, child_name, device_id, device_name)
 
-    _LOGGER.debug(f"Created {len(entities)} total sensor entities")
-    async_add_entities(entities, update_before_add=True)
+    # The first refresh has already populated coordinator.data and every
+    # entity sets its state from it, so no per-entity update is needed here.
+    async_add_entities(_iter_entities(), update_before_add=False)
 
 
-class ScreenTimeRemainingSensor(CoordinatorEntity, SensorEntity):
+class DeviceTimeSensor(CoordinatorEntity, SensorEntity, ABC):
+	"""Base class for per-device time sensors."""
+
+	def __init__(
+		self,
+		coordinator: FamilyLinkDataUpdateCoordinator,
+		child_id: str,
+		child_name: str,
+		device_id: str,
+		device_name: str,
+	) -> None:
+		"""Initialize the sensor."""
+		super().__init__(coordinator)
+
+		self._child_id = child_id
+		self._child_name = child_name
+		self._device_id = device_id
+		self._device_name = device_name
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, f"{child_id}_{device_id}")},
+			name=device_name,
+			manufacturer="Google",
+			model="Family Link Device",
+			via_device=(DOMAIN, child_id),
+		)
+
+	def _get_time_data(self) -> dict[str, Any] | None:
+		"""Return the time data of this device, or None if unknown."""
+		data = self.coordinator.data
+		if not data:
+			return None
+
+		return data.get("time_data_by_ids", _EMPTY).get((self._child_id, self._device_id))
+
+	def _refresh_state(self) -> None:
+		"""Recompute the cached state and attributes from coordinator data."""
+		time_data = self._get_time_data()
+		self._attr_native_value = self._compute_native_value(time_data)
+		self._attr_extra_state_attributes = self._compute_attributes(time_data)
+
+	@abstractmethod
+	def _compute_native_value(self, time_data: dict[str, Any] | None) -> Any:
+		"""Return the sensor state for the given device time data."""
+
+	def _compute_attributes(self, time_data: dict[str, Any] | None) -> dict[str, Any]:
+		"""Return the extra state attributes for the given device time data."""
+		return {
+			"child_id": self._child_id,
+			"child_name": self._child_name,
+			"device_id": self._device_id,
+			"device_name": self._device_name,
+		}
+
+	async def async_added_to_hass(self) -> None:
+		"""Compute the initial state before the entity is first written."""
+		await super().async_added_to_hass()
+		self._refresh_state()
+
+	@callback
+	def _handle_coordinator_update(self) -> None:
+		"""Rebuild state once per coordinator update instead of on every read."""
+		self._refresh_state()
+		super()._handle_coordinator_update()
+
+
+class ScreenTimeRemainingSensor(DeviceTimeSensor):
     """Sensor showing remaining screen time for a device."""
 
     def __init__(
@@ -129,12 +257,8 @@ class ScreenTimeRemainingSensor(CoordinatorEntity, SensorEntity):
         device_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, child_id, child_name, device_id, device_name)
 
-        self._child_id = child_id
-        self._child_name = child_name
-        self._device_id = device_id
-        self._device_name = device_name
         self._attr_name = f"{device_name} Screen Time Remaining"
         self._attr_unique_id = f"{DOMAIN}_{child_id}_{device_id}_screen_time_remaining"
         self._attr_icon = "mdi:clock-time-four-outline"
@@ -142,86 +266,45 @@ class ScreenTimeRemainingSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = SensorDeviceClass.DURATION
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-            name=self._device_name,
-            manufacturer="Google",
-            model="Family Link Device",
-            via_device=(DOMAIN, self._child_id),
+    def _compute_native_value(self, time_data: dict[str, Any] | None) -> int | None:
+        """Return remaining screen time in minutes."""
+        if time_data is None:
+            _LOGGER.debug("Device ID '%s' not found in devices_time_data", self._device_id)
+            return None
+
+        remaining = time_data.get("remaining_minutes", 0)
+        _LOGGER.debug(
+            "Found data for %s: remaining=%s, total=%s, used=%s",
+            self._device_id,
+            remaining,
+            time_data.get("total_allowed_minutes"),
+            time_data.get("used_minutes"),
         )
+        return remaining
 
-    @property
-    def native_value(self) -> int | None:
-        """Return remaining screen time in minutes."""
-        if self.coordinator.data and "children_data" in self.coordinator.data:
-            for child_data in self.coordinator.data["children_data"]:
-                if child_data["child_id"] == self._child_id:
-                    devices_time_data = child_data.get("devices_time_data", {})
-
-                    _LOGGER.debug(
-                        f"ScreenTimeRemaining for device '{self._device_id}': "
-                        f"devices_time_data keys = {list(devices_time_data.keys())}"
-                    )
-
-                    if self._device_id in devices_time_data:
-                        time_data = devices_time_data[self._device_id]
-                        remaining = time_data.get("remaining_minutes", 0)
-                        _LOGGER.debug(
-                            f"Found data for {self._device_id}: remaining={remaining}, "
-                            f"total={time_data.get('total_allowed_minutes')}, used={time_data.get('used_minutes')}"
-                        )
-                        return remaining
-                    else:
-                        _LOGGER.debug(
-                            f"Device ID '{self._device_id}' not found in devices_time_data "
-                            f"(available: {list(devices_time_data.keys())})"
-                        )
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _compute_attributes(self, time_data: dict[str, Any] | None) -> dict[str, Any]:
         """Return extra state attributes."""
-        attributes = {
-            "child_id": self._child_id,
-            "child_name": self._child_name,
-            "device_id": self._device_id,
-            "device_name": self._device_name,
-        }
-
-        if self.coordinator.data and "children_data" in self.coordinator.data:
-            for child_data in self.coordinator.data["children_data"]:
-                if child_data["child_id"] == self._child_id:
-                    devices_time_data = child_data.get("devices_time_data", {})
-
-                    if self._device_id in devices_time_data:
-                        time_data = devices_time_data[self._device_id]
-
-                        attributes["total_allowed_minutes"] = time_data.get("total_allowed_minutes", 0)
-                        attributes["used_minutes"] = time_data.get("used_minutes", 0)
-                        attributes["daily_limit_enabled"] = time_data.get("daily_limit_enabled", False)
-                        attributes["daily_limit_minutes"] = time_data.get("daily_limit_minutes", 0)
-
-                        # Calculate percentage used
-                        total = time_data.get("total_allowed_minutes", 0)
-                        used = time_data.get("used_minutes", 0)
-                        if total > 0:
-                            attributes["percentage_used"] = round((used / total) * 100, 1)
-                        else:
-                            attributes["percentage_used"] = 0
+        attributes = super()._compute_attributes(time_data)
+        if time_data is not None:
+            attributes["total_allowed_minutes"] = time_data.get("total_allowed_minutes", 0)
+            attributes["used_minutes"] = time_data.get("used_minutes", 0)
+            attributes["daily_limit_enabled"] = time_data.get("daily_limit_enabled", False)
+            attributes["daily_limit_minutes"] = time_data.get("daily_limit_minutes", 0)
+            attributes["percentage_used"] = time_data.get("percentage_used", 0)
 
         return attributes
 
 
-class NextRestrictionSensor(CoordinatorEntity, SensorEntity):
+# Label per next restriction kind (see coordinator._classify_next_restriction)
+_NEXT_RESTRICTION_TEMPLATES = {
+    "bedtime_active": "Bedtime (ends {})",
+    "schooltime_active": "School time (ends {})",
+    "bedtime_upcoming": "Bedtime {}",
+    "schooltime_upcoming": "School time {}",
+}
+
+
+class NextRestrictionSensor(DeviceTimeSensor):
     """Sensor showing the next upcoming time restriction."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -235,30 +318,30 @@ class NextRestrictionSensor(CoordinatorEntity, SensorEntity):
         device_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, child_id, child_name, device_id, device_name)
 
-        self._child_id = child_id
-        self._child_name = child_name
-        self._device_id = device_id
-        self._device_name = device_name
         self._attr_name = f"{device_name} Next Restriction"
         self._attr_unique_id = f"{DOMAIN}_{child_id}_{device_id}_next_restriction"
         self._attr_icon = "mdi:clock-alert-outline"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-            name=self._device_name,
-            manufacturer="Google",
-            model="Family Link Device",
-            via_device=(DOMAIN, self._child_id),
+    async def async_added_to_hass(self) -> None:
+        """Also tick on the poll interval so the countdown moves on unchanged polls."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_refresh_countdown, self.coordinator.update_interval
+            )
         )
 
+    @callback
+    def _async_refresh_countdown(self, _now: Any) -> None:
+        """Recompute the relative label against the current time."""
+        self._refresh_state()
+        self.async_write_ha_state()
+
     def _calculate_time_until(self, target_ms: int) -> str | None:
         """Calculate human-readable time until target timestamp."""
-        now_ms = int(datetime.now().timestamp() * 1000)
+        now_ms = time.time_ns() // 1_000_000
         diff_ms = target_ms - now_ms
 
         if diff_ms <= 0:
@@ -273,116 +356,54 @@ class NextRestrictionSensor(CoordinatorEntity, SensorEntity):
         else:
             return f"in {minutes}min"
 
-    @property
-    def native_value(self) -> str | None:
+    def _compute_native_value(self, time_data: dict[str, Any] | None) -> str | None:
         """Return description of next restriction."""
-        if self.coordinator.data and "children_data" in self.coordinator.data:
-            for child_data in self.coordinator.data["children_data"]:
-                if child_data["child_id"] == self._child_id:
-                    devices_time_data = child_data.get("devices_time_data", {})
-
-                    if self._device_id in devices_time_data:
-                        time_data = devices_time_data[self._device_id]
-
-                        # Check if bedtime is active
-                        if time_data.get("bedtime_active"):
-                            bedtime_window = time_data.get("bedtime_window")
-                            if bedtime_window:
-                                end_ms = bedtime_window.get("end_ms")
-                                if end_ms:
-                                    return f"Bedtime (ends {self._calculate_time_until(end_ms)})"
-
-                        # Check if school time is active
-                        if time_data.get("schooltime_active"):
-                            schooltime_window = time_data.get("schooltime_window")
-                            if schooltime_window:
-                                end_ms = schooltime_window.get("end_ms")
-                                if end_ms:
-                                    return f"School time (ends {self._calculate_time_until(end_ms)})"
-
-                        # Check upcoming bedtime
-                        bedtime_window = time_data.get("bedtime_window")
-                        if bedtime_window:
-                            start_ms = bedtime_window.get("start_ms")
-                            if start_ms:
-                                time_until = self._calculate_time_until(start_ms)
-                                if time_until and time_until != "Active now":
-                                    return f"Bedtime {time_until}"
-
-                        # Check upcoming school time
-                        schooltime_window = time_data.get("schooltime_window")
-                        if schooltime_window:
-                            start_ms = schooltime_window.get("start_ms")
-                            if start_ms:
-                                time_until = self._calculate_time_until(start_ms)
-                                if time_until and time_until != "Active now":
-                                    return f"School time {time_until}"
-
-                        # Check if daily limit is about to be reached
-                        remaining = time_data.get("remaining_minutes", 0)
-                        if time_data.get("daily_limit_enabled") and remaining > 0 and remaining <= 30:
-                            return f"Daily limit {remaining}min remaining"
-
-                        return "No restrictions"
-
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+        if time_data is None:
+            return None
+
+        # The coordinator already picked the restriction; only the relative
+        # time label is computed here.
+        kind = time_data.get("next_restriction_kind", "none")
+        target_ms = time_data.get("next_restriction_target_ms")
+
+        # An upcoming window may have started since the last poll. The active
+        # flags are still from that poll, so classify again against the
+        # current time, which skips past windows that have already started.
+        if kind.endswith("_upcoming") and target_ms is not None:
+            now_ms = time.time_ns() // 1_000_000
+            if target_ms <= now_ms:
+                kind, target_ms = _classify_next_restriction(time_data, now_ms)
+
+        if kind == "daily_limit_low":
+            return f"Daily limit {time_data.get('remaining_minutes', 0)}min remaining"
+
+        template = _NEXT_RESTRICTION_TEMPLATES.get(kind)
+        if template is None:
+            return "No restrictions"
+
+        return template.format(self._calculate_time_until(target_ms))
+
+    def _compute_attributes(self, time_data: dict[str, Any] | None) -> dict[str, Any]:
         """Return extra state attributes."""
-        attributes = {
-            "child_id": self._child_id,
-            "child_name": self._child_name,
-            "device_id": self._device_id,
-            "device_name": self._device_name,
-        }
-
-        if self.coordinator.data and "children_data" in self.coordinator.data:
-            for child_data in self.coordinator.data["children_data"]:
-                if child_data["child_id"] == self._child_id:
-                    devices_time_data = child_data.get("devices_time_data", {})
-
-                    if self._device_id in devices_time_data:
-                        time_data = devices_time_data[self._device_id]
-
-                        attributes["bedtime_active"] = time_data.get("bedtime_active", False)
-                        attributes["schooltime_active"] = time_data.get("schooltime_active", False)
-
-                        # Add window details if available
-                        bedtime_window = time_data.get("bedtime_window")
-                        if bedtime_window:
-                            start_ms = bedtime_window.get("start_ms")
-                            end_ms = bedtime_window.get("end_ms")
-                            if start_ms:
-                                try:
-                                    attributes["bedtime_start"] = datetime.fromtimestamp(start_ms / 1000).isoformat()
-                                except (ValueError, OSError):
-                                    pass
-                            if end_ms:
-                                try:
-                                    attributes["bedtime_end"] = datetime.fromtimestamp(end_ms / 1000).isoformat()
-                                except (ValueError, OSError):
-                                    pass
-
-                        schooltime_window = time_data.get("schooltime_window")
-                        if schooltime_window:
-                            start_ms = schooltime_window.get("start_ms")
-                            end_ms = schooltime_window.get("end_ms")
-                            if start_ms:
-                                try:
-                                    attributes["schooltime_start"] = datetime.fromtimestamp(start_ms / 1000).isoformat()
-                                except (ValueError, OSError):
-                                    pass
-                            if end_ms:
-                                try:
-                                    attributes["schooltime_end"] = datetime.fromtimestamp(end_ms / 1000).isoformat()
-                                except (ValueError, OSError):
-                                    pass
+        attributes = super()._compute_attributes(time_data)
+        if time_data is not None:
+            attributes["bedtime_active"] = time_data.get("bedtime_active", False)
+            attributes["schooltime_active"] = time_data.get("schooltime_active", False)
+
+            # Add window details if available
+            bedtime_window = time_data.get("bedtime_window")
+            if bedtime_window:
+                if "start_iso" in bedtime_window:
+                    attributes["bedtime_start"] = bedtime_window["start_iso"]
+                if "end_iso" in bedtime_window:
+                    attributes["bedtime_end"] = bedtime_window["end_iso"]
+
+            schooltime_window = time_data.get("schooltime_window")
+            if schooltime_window:
+                if "start_iso" in schooltime_window:
+                    attributes["schooltime_start"] = schooltime_window["start_iso"]
+                if "end_iso" in schooltime_window:
+                    attributes["schooltime_end"] = schooltime_window["end_iso"]
 
         return attributes
 
@@ -409,14 +430,10 @@ class FamilyLinkScreenTimeSensor(ChildDataMixin, CoordinatorEntity, SensorEntity
 		self._attr_name = f"{child_name} Daily Screen Time"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_screen_time_{sensor_type}"
 
-	@property
-	def native_value(self) -> float | None:
+	def _compute_native_value(self) -> float | None:
 		"""Return the state of the sensor in minutes."""
 		child_data = self._get_child_data()
-		if not child_data or "screen_time" not in child_data:
-			return None
-
-		screen_time = child_data["screen_time"]
+		screen_time = child_data.get("screen_time") if child_data else None
 		if not screen_time:
 			return None
 
@@ -427,25 +444,16 @@ class FamilyLinkScreenTimeSensor(ChildDataMixin, CoordinatorEntity, SensorEntity
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "screen_time" in child_data
-			and child_data["screen_time"] is not None
-		)
+		return self._has_key("screen_time")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
-		if not child_data or "screen_time" not in child_data:
-			return {}
-
-		screen_time = child_data["screen_time"]
+		screen_time = child_data.get("screen_time") if child_data else None
 		if not screen_time:
 			return {}
 
+		app_breakdown = screen_time.get("app_breakdown", _EMPTY)
 		attributes = {
 			"child_id": self._child_id,
 			"child_name": self._child_name,
@@ -454,37 +462,22 @@ class FamilyLinkScreenTimeSensor(ChildDataMixin, CoordinatorEntity, SensorEntity
 			"hours": screen_time.get("hours", 0),
 			"minutes": screen_time.get("minutes", 0),
 			"seconds": screen_time.get("seconds", 0),
-			"date": str(screen_time.get("date", datetime.now().date())),
-			"app_count": len(screen_time.get("app_breakdown", {})),
+			"date": screen_time.get("date_str"),
+			"app_count": len(app_breakdown),
 		}
 
 		# Add all apps by usage (dynamically truncated to fit HA's 16KB limit)
-		app_breakdown = screen_time.get("app_breakdown", {})
 		if app_breakdown:
-			# Build package-to-name lookup from apps data
-			app_names: dict[str, str] = {}
-			for app in child_data.get("apps", []):
-				pkg = app.get("packageName", "")
-				if pkg:
-					app_names[pkg] = app.get("title", pkg)
-
-			sorted_apps = sorted(
-				app_breakdown.items(),
-				key=lambda x: x[1],
-				reverse=True
-			)
-
-			app_list = []
-			for package, seconds in sorted_apps:
-				hours = int(seconds // 3600)
-				mins = int((seconds % 3600) // 60)
-				secs = int(seconds % 60)
-				app_list.append({
-					"name": app_names.get(package, package),
-					"package": package,
-					"time": f"{hours:02d}:{mins:02d}:{secs:02d}",
-					"minutes": round(seconds / 60, 1),
-				})
+			app_names = child_data.get("app_titles", _EMPTY)
+			app_list = [
+				{
+					"name": app_names.get(app["package"], app["package"]),
+					"package": app["package"],
+					"time": app["formatted"],
+					"minutes": app["minutes"],
+				}
+				for app in screen_time.get("sorted_apps", ())
+			]
 
 			truncated_apps, was_truncated = _truncate_app_list(app_list, attributes)
 			attributes["apps"] = truncated_apps
@@ -511,14 +504,10 @@ class FamilyLinkScreenTimeFormattedSensor(ChildDataMixin, CoordinatorEntity, Sen
 		self._attr_name = f"{child_name} Screen Time Formatted"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_screen_time_formatted"
 
-	@property
-	def native_value(self) -> str | None:
+	def _compute_native_value(self) -> str | None:
 		"""Return the state of the sensor as formatted time."""
 		child_data = self._get_child_data()
-		if not child_data or "screen_time" not in child_data:
-			return None
-
-		screen_time = child_data["screen_time"]
+		screen_time = child_data.get("screen_time") if child_data else None
 		if not screen_time:
 			return None
 
@@ -527,22 +516,12 @@ class FamilyLinkScreenTimeFormattedSensor(ChildDataMixin, CoordinatorEntity, Sen
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "screen_time" in child_data
-			and child_data["screen_time"] is not None
-		)
+		return self._has_key("screen_time")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
-		if not child_data or "screen_time" not in child_data:
-			return {}
-
-		screen_time = child_data["screen_time"]
+		screen_time = child_data.get("screen_time") if child_data else None
 		if not screen_time:
 			return {}
 
@@ -554,7 +533,7 @@ class FamilyLinkScreenTimeFormattedSensor(ChildDataMixin, CoordinatorEntity, Sen
 			"hours": screen_time.get("hours", 0),
 			"minutes": screen_time.get("minutes", 0),
 			"seconds": screen_time.get("seconds", 0),
-			"date": str(screen_time.get("date", datetime.now().date())),
+			"date": screen_time.get("date_str"),
 		}
 
 
@@ -575,8 +554,7 @@ class FamilyLinkAppCountSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
 		self._attr_name = f"{child_name} Installed Apps"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_app_count"
 
-	@property
-	def native_value(self) -> int | None:
+	def _compute_native_value(self) -> int | None:
 		"""Return the number of installed apps."""
 		child_data = self._get_child_data()
 		if not child_data or "apps" not in child_data:
@@ -586,32 +564,23 @@ class FamilyLinkAppCountSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "apps" in child_data
-		)
+		return self._has_key("apps")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
 		if not child_data or "apps" not in child_data:
 			return {}
 
-		apps = child_data["apps"]
-		blocked = sum(1 for app in apps if app.get("supervisionSetting", {}).get("hidden", False))
-		with_limits = sum(1 for app in apps if app.get("supervisionSetting", {}).get("usageLimit"))
-		always_allowed = sum(1 for app in apps if app.get("supervisionSetting", {}).get("alwaysAllowedAppInfo"))
+		app_groups = child_data.get("app_groups", _EMPTY)
 
 		return {
 			"child_id": self._child_id,
 			"child_name": self._child_name,
-			"total_apps": len(apps),
-			"blocked_apps": blocked,
-			"apps_with_time_limits": with_limits,
-			"always_allowed_apps": always_allowed,
+			"total_apps": len(child_data["apps"]),
+			"blocked_apps": len(app_groups.get("blocked", ())),
+			"apps_with_time_limits": len(app_groups.get("with_limits", ())),
+			"always_allowed_apps": len(app_groups.get("always_allowed", ())),
 		}
 
 
@@ -657,53 +626,28 @@ class FamilyLinkBlockedAppsSensor(ChildDataMixin, CoordinatorEntity, SensorEntit
 		self._attr_name = f"{child_name} Blocked Apps"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_blocked_apps"
 
-	@property
-	def native_value(self) -> int:
+	def _compute_native_value(self) -> int:
 		"""Return the number of blocked apps."""
 		child_data = self._get_child_data()
 		if not child_data or "apps" not in child_data:
 			return 0
 
-		apps = child_data["apps"]
-		return sum(1 for app in apps if app.get("supervisionSetting", {}).get("hidden", False))
+		return len(child_data.get("app_groups", _EMPTY).get("blocked", ()))
 
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "apps" in child_data
-		)
+		return self._has_key("apps")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
 		if not child_data or "apps" not in child_data:
 			return {}
 
-		apps = child_data["apps"]
-		blocked_apps = [
-			{
-				"name": app.get("title", "Unknown"),
-				"package": app.get("packageName", ""),
-			}
-			for app in apps
-			if app.get("supervisionSetting", {}).get("hidden", False)
-		]
-
-		base_attrs = {
-			"child_id": self._child_id,
-			"child_name": self._child_name,
-			"count": len(blocked_apps),
-		}
-		truncated_apps, was_truncated = _truncate_app_list(blocked_apps, base_attrs)
-		base_attrs["apps"] = truncated_apps
-		if was_truncated:
-			base_attrs["truncated"] = True
-		return base_attrs
+		blocked_apps = child_data.get("app_groups", _EMPTY).get("blocked", [])
+
+		return self._app_list_attributes(blocked_apps)
 
 
 class FamilyLinkAppsWithLimitsSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
@@ -722,56 +666,28 @@ class FamilyLinkAppsWithLimitsSensor(ChildDataMixin, CoordinatorEntity, SensorEn
 		self._attr_name = f"{child_name} Apps with Time Limits"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_apps_with_limits"
 
-	@property
-	def native_value(self) -> int:
+	def _compute_native_value(self) -> int:
 		"""Return the number of apps with time limits."""
 		child_data = self._get_child_data()
 		if not child_data or "apps" not in child_data:
 			return 0
 
-		apps = child_data["apps"]
-		return sum(1 for app in apps if app.get("supervisionSetting", {}).get("usageLimit"))
+		return len(child_data.get("app_groups", _EMPTY).get("with_limits", ()))
 
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "apps" in child_data
-		)
+		return self._has_key("apps")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
 		if not child_data or "apps" not in child_data:
 			return {}
 
-		apps = child_data["apps"]
-		apps_with_limits = []
+		apps_with_limits = child_data.get("app_groups", _EMPTY).get("with_limits", [])
 
-		for app in apps:
-			usage_limit = app.get("supervisionSetting", {}).get("usageLimit")
-			if usage_limit:
-				apps_with_limits.append({
-					"name": app.get("title", "Unknown"),
-					"package": app.get("packageName", ""),
-					"limit_minutes": usage_limit.get("dailyUsageLimitMins", 0),
-					"enabled": usage_limit.get("enabled", False),
-				})
-
-		base_attrs = {
-			"child_id": self._child_id,
-			"child_name": self._child_name,
-			"count": len(apps_with_limits),
-		}
-		truncated_apps, was_truncated = _truncate_app_list(apps_with_limits, base_attrs)
-		base_attrs["apps"] = truncated_apps
-		if was_truncated:
-			base_attrs["truncated"] = True
-		return base_attrs
+		return self._app_list_attributes(apps_with_limits)
 
 
 class FamilyLinkAppsWithoutLimitsSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
@@ -796,54 +712,25 @@ class FamilyLinkAppsWithoutLimitsSensor(ChildDataMixin, CoordinatorEntity, Senso
 		if not child_data or "apps" not in child_data:
 			return []
 
-		result = []
-		for app in child_data["apps"]:
-			supervision = app.get("supervisionSetting", {})
-			if supervision.get("hidden", False):
-				continue
-			if supervision.get("usageLimit"):
-				continue
-			if supervision.get("alwaysAllowedAppInfo"):
-				continue
-			result.append({
-				"name": app.get("title", "Unknown"),
-				"package": app.get("packageName", ""),
-			})
-		return result
+		return child_data.get("app_groups", _EMPTY).get("without_limits", [])
 
-	@property
-	def native_value(self) -> int:
+	def _compute_native_value(self) -> int:
 		"""Return the number of apps without limits."""
 		return len(self._get_apps_without_limits())
 
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "apps" in child_data
-		)
+		return self._has_key("apps")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		apps_without_limits = self._get_apps_without_limits()
 
 		if not apps_without_limits:
 			return {}
 
-		base_attrs = {
-			"child_id": self._child_id,
-			"child_name": self._child_name,
-			"count": len(apps_without_limits),
-		}
-		truncated_apps, was_truncated = _truncate_app_list(apps_without_limits, base_attrs)
-		base_attrs["apps"] = truncated_apps
-		if was_truncated:
-			base_attrs["truncated"] = True
-		return base_attrs
+		return self._app_list_attributes(apps_without_limits)
 
 
 class FamilyLinkAlwaysAllowedAppsSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
@@ -868,49 +755,25 @@ class FamilyLinkAlwaysAllowedAppsSensor(ChildDataMixin, CoordinatorEntity, Senso
 		if not child_data or "apps" not in child_data:
 			return []
 
-		result = []
-		for app in child_data["apps"]:
-			supervision = app.get("supervisionSetting", {})
-			if supervision.get("alwaysAllowedAppInfo"):
-				result.append({
-					"name": app.get("title", "Unknown"),
-					"package": app.get("packageName", ""),
-				})
-		return result
+		return child_data.get("app_groups", _EMPTY).get("always_allowed", [])
 
-	@property
-	def native_value(self) -> int:
+	def _compute_native_value(self) -> int:
 		"""Return the number of always-allowed apps."""
 		return len(self._get_always_allowed_apps())
 
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "apps" in child_data
-		)
+		return self._has_key("apps")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		always_allowed_apps = self._get_always_allowed_apps()
 
 		if not always_allowed_apps:
 			return {}
 
-		base_attrs = {
-			"child_id": self._child_id,
-			"child_name": self._child_name,
-			"count": len(always_allowed_apps),
-		}
-		truncated_apps, was_truncated = _truncate_app_list(always_allowed_apps, base_attrs)
-		base_attrs["apps"] = truncated_apps
-		if was_truncated:
-			base_attrs["truncated"] = True
-		return base_attrs
+		return self._app_list_attributes(always_allowed_apps)
 
 
 class FamilyLinkTopAppSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
@@ -933,79 +796,41 @@ class FamilyLinkTopAppSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
 		self._attr_name = f"{child_name} Top App #{rank}"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_top_app_{rank}"
 
-	@property
-	def native_value(self) -> float | None:
-		"""Return usage time in minutes for this top app."""
+	def _get_ranked_app(self) -> dict[str, Any] | None:
+		"""Return the ranked app entry for this rank, or None if there is no such app."""
 		child_data = self._get_child_data()
-		if not child_data or "screen_time" not in child_data:
+		if not child_data or not child_data.get("screen_time"):
 			return None
 
-		screen_time = child_data["screen_time"]
-		if not screen_time:
+		# Pre-ranked by the coordinator (most used first)
+		top_apps = child_data["screen_time"].get("top_apps", ())
+		if len(top_apps) < self._rank:
 			return None
 
-		app_breakdown = screen_time.get("app_breakdown", {})
-		if not app_breakdown:
-			return None
+		return top_apps[self._rank - 1]
 
-		# Sort apps by usage
-		sorted_apps = sorted(app_breakdown.items(), key=lambda x: x[1], reverse=True)
-
-		# Check if this rank exists
-		if len(sorted_apps) < self._rank:
+	def _compute_native_value(self) -> float | None:
+		"""Return usage time in minutes for this top app."""
+		ranked_app = self._get_ranked_app()
+		if ranked_app is None:
 			return None
 
 		# Return usage in minutes
-		package, seconds = sorted_apps[self._rank - 1]
-		return round(seconds / 60, 1)
+		return ranked_app["minutes"]
 
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		if not (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "screen_time" in child_data
-		):
-			return False
-
-		screen_time = child_data["screen_time"]
-		if not screen_time:
-			return False
+		return self.coordinator.last_update_success and self._get_ranked_app() is not None
 
-		app_breakdown = screen_time.get("app_breakdown", {})
-		return len(app_breakdown) >= self._rank
-
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
-		child_data = self._get_child_data()
-		if not child_data or "screen_time" not in child_data:
+		ranked_app = self._get_ranked_app()
+		if ranked_app is None:
 			return {}
 
-		screen_time = child_data["screen_time"]
-		if not screen_time:
-			return {}
-
-		app_breakdown = screen_time.get("app_breakdown", {})
-		if not app_breakdown or len(app_breakdown) < self._rank:
-			return {}
-
-		sorted_apps = sorted(app_breakdown.items(), key=lambda x: x[1], reverse=True)
-		package, seconds = sorted_apps[self._rank - 1]
-
-		# Find app details
-		app_name = package
-		apps = child_data.get("apps", [])
-		for app in apps:
-			if app.get("packageName") == package:
-				app_name = app.get("title", package)
-				break
-
-		hours = int(seconds // 3600)
-		mins = int((seconds % 3600) // 60)
-		secs = int(seconds % 60)
+		package = ranked_app["package"]
+		app_name = self._get_child_data().get("app_titles", _EMPTY).get(package, package)
 
 		return {
 			"child_id": self._child_id,
@@ -1013,10 +838,10 @@ class FamilyLinkTopAppSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
 			"rank": self._rank,
 			"app_name": app_name,
 			"package_name": package,
-			"total_seconds": seconds,
-			"formatted_time": f"{hours:02d}:{mins:02d}:{secs:02d}",
-			"hours": hours,
-			"minutes": mins,
+			"total_seconds": ranked_app["seconds"],
+			"formatted_time": ranked_app["formatted"],
+			"hours": ranked_app["hours"],
+			"minutes": ranked_app["mins"],
 		}
 
 
@@ -1037,8 +862,7 @@ class FamilyLinkDeviceCountSensor(ChildDataMixin, CoordinatorEntity, SensorEntit
 		self._attr_name = f"{child_name} Device Count"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_device_count"
 
-	@property
-	def native_value(self) -> int:
+	def _compute_native_value(self) -> int:
 		"""Return the number of devices."""
 		child_data = self._get_child_data()
 		if not child_data or "devices" not in child_data:
@@ -1048,35 +872,19 @@ class FamilyLinkDeviceCountSensor(ChildDataMixin, CoordinatorEntity, SensorEntit
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "devices" in child_data
-		)
+		return self._has_key("devices")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
 		if not child_data or "devices" not in child_data:
 			return {}
 
-		devices = child_data["devices"]
-		device_list = [
-			{
-				"name": device.get("name", "Unknown"),
-				"model": device.get("model", "Unknown"),
-				"id": device.get("id", ""),
-			}
-			for device in devices
-		]
-
 		return {
 			"child_id": self._child_id,
 			"child_name": self._child_name,
-			"count": len(devices),
-			"devices": device_list,
+			"count": len(child_data["devices"]),
+			"devices": child_data["device_list"],
 		}
 
 
@@ -1096,14 +904,10 @@ class FamilyLinkChildInfoSensor(ChildDataMixin, CoordinatorEntity, SensorEntity)
 		self._attr_name = f"{child_name} Child Info"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_child_info"
 
-	@property
-	def native_value(self) -> str | None:
+	def _compute_native_value(self) -> str | None:
 		"""Return the child's display name."""
 		child_data = self._get_child_data()
-		if not child_data or "child" not in child_data:
-			return None
-
-		child = child_data["child"]
+		child = child_data.get("child") if child_data else None
 		if not child:
 			return None
 
@@ -1112,22 +916,12 @@ class FamilyLinkChildInfoSensor(ChildDataMixin, CoordinatorEntity, SensorEntity)
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		return (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "child" in child_data
-			and child_data["child"] is not None
-		)
+		return self._has_key("child")
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
-		if not child_data or "child" not in child_data:
-			return {}
-
-		child = child_data["child"]
+		child = child_data.get("child") if child_data else None
 		if not child:
 			return {}
 
@@ -1154,7 +948,7 @@ class FamilyLinkChildInfoSensor(ChildDataMixin, CoordinatorEntity, SensorEntity)
 		return attrs
 
 
-class DailyLimitDeviceSensor(CoordinatorEntity, SensorEntity):
+class DailyLimitDeviceSensor(DeviceTimeSensor):
 	"""Sensor showing daily limit quota for a specific device."""
 
 	def __init__(
@@ -1166,12 +960,8 @@ class DailyLimitDeviceSensor(CoordinatorEntity, SensorEntity):
 		device_name: str,
 	) -> None:
 		"""Initialize the sensor."""
-		super().__init__(coordinator)
+		super().__init__(coordinator, child_id, child_name, device_id, device_name)
 
-		self._child_id = child_id
-		self._child_name = child_name
-		self._device_id = device_id
-		self._device_name = device_name
 		self._attr_name = f"{device_name} Daily Limit"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_{device_id}_daily_limit"
 		self._attr_icon = "mdi:timer-outline"
@@ -1179,59 +969,23 @@ class DailyLimitDeviceSensor(CoordinatorEntity, SensorEntity):
 		self._attr_device_class = SensorDeviceClass.DURATION
 		self._attr_state_class = SensorStateClass.MEASUREMENT
 
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-			name=self._device_name,
-			manufacturer="Google",
-			model="Family Link Device",
-			via_device=(DOMAIN, self._child_id),
-		)
-
-	@property
-	def native_value(self) -> int | None:
+	def _compute_native_value(self, time_data: dict[str, Any] | None) -> int | None:
 		"""Return configured daily limit in minutes."""
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					devices_time_data = child_data.get("devices_time_data", {})
-
-					if self._device_id in devices_time_data:
-						time_data = devices_time_data[self._device_id]
-						return time_data.get("daily_limit_minutes", 0)
+		if time_data is not None:
+			return time_data.get("daily_limit_minutes", 0)
 
 		return None
 
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
-
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self, time_data: dict[str, Any] | None) -> dict[str, Any]:
 		"""Return extra state attributes."""
-		attributes = {
-			"child_id": self._child_id,
-			"child_name": self._child_name,
-			"device_id": self._device_id,
-			"device_name": self._device_name,
-		}
-
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					devices_time_data = child_data.get("devices_time_data", {})
-
-					if self._device_id in devices_time_data:
-						time_data = devices_time_data[self._device_id]
-						attributes["enabled"] = time_data.get("daily_limit_enabled", False)
+		attributes = super()._compute_attributes(time_data)
+		if time_data is not None:
+			attributes["enabled"] = time_data.get("daily_limit_enabled", False)
 
 		return attributes
 
 
-class ActiveBonusSensor(CoordinatorEntity, SensorEntity):
+class ActiveBonusSensor(DeviceTimeSensor):
 	"""Sensor showing active time bonus for a device."""
 
 	def __init__(
@@ -1243,12 +997,8 @@ class ActiveBonusSensor(CoordinatorEntity, SensorEntity):
 		device_name: str,
 	) -> None:
 		"""Initialize the sensor."""
-		super().__init__(coordinator)
+		super().__init__(coordinator, child_id, child_name, device_id, device_name)
 
-		self._child_id = child_id
-		self._child_name = child_name
-		self._device_id = device_id
-		self._device_name = device_name
 		self._attr_name = f"{device_name} Active Bonus"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_{device_id}_active_bonus"
 		self._attr_icon = "mdi:clock-plus-outline"
@@ -1256,58 +1006,37 @@ class ActiveBonusSensor(CoordinatorEntity, SensorEntity):
 		self._attr_device_class = SensorDeviceClass.DURATION
 		self._attr_state_class = SensorStateClass.MEASUREMENT
 
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-			name=self._device_name,
-			manufacturer="Google",
-			model="Family Link Device",
-			via_device=(DOMAIN, self._child_id),
-		)
-
-	@property
-	def native_value(self) -> int | None:
+	def _compute_native_value(self, time_data: dict[str, Any] | None) -> int | None:
 		"""Return active bonus time in minutes."""
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					devices_time_data = child_data.get("devices_time_data", {})
-
-					if self._device_id in devices_time_data:
-						time_data = devices_time_data[self._device_id]
-						# 0 when no bonus is active
-						return time_data.get("bonus_minutes", 0)
+		if time_data is not None:
+			# 0 when no bonus is active
+			return time_data.get("bonus_minutes", 0)
 
 		return None
 
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
-
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self, time_data: dict[str, Any] | None) -> dict[str, Any]:
 		"""Return extra state attributes."""
-		attributes = {
-			"child_id": self._child_id,
-			"child_name": self._child_name,
-			"device_id": self._device_id,
-			"device_name": self._device_name,
-		}
+		attributes = super()._compute_attributes(time_data)
+		if time_data is not None:
+			bonus_mins = time_data.get("bonus_minutes", 0)
+			attributes["has_bonus"] = bonus_mins > 0
 
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					devices_time_data = child_data.get("devices_time_data", {})
+		return attributes
 
-					if self._device_id in devices_time_data:
-						time_data = devices_time_data[self._device_id]
-						bonus_mins = time_data.get("bonus_minutes", 0)
-						attributes["has_bonus"] = bonus_mins > 0
 
-		return attributes
+# Battery icon per 10% bucket (index = level // 10, clamped to 0..9)
+_BATTERY_ICONS = (
+	"mdi:battery-alert-variant-outline",  # < 10%
+	"mdi:battery-20",
+	"mdi:battery-20",
+	"mdi:battery-40",
+	"mdi:battery-40",
+	"mdi:battery-60",
+	"mdi:battery-60",
+	"mdi:battery-80",
+	"mdi:battery-80",
+	"mdi:battery",  # >= 90%
+)
 
 
 class FamilyLinkBatteryLevelSensor(ChildDataMixin, CoordinatorEntity, SensorEntity):
@@ -1330,14 +1059,10 @@ class FamilyLinkBatteryLevelSensor(ChildDataMixin, CoordinatorEntity, SensorEnti
 		self._attr_name = f"{child_name} Battery Level"
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_battery_level"
 
-	@property
-	def native_value(self) -> int | None:
+	def _compute_native_value(self) -> int | None:
 		"""Return the battery level percentage."""
 		child_data = self._get_child_data()
-		if not child_data or "location" not in child_data:
-			return None
-
-		location = child_data["location"]
+		location = child_data.get("location") if child_data else None
 		if not location:
 			return None
 
@@ -1346,17 +1071,11 @@ class FamilyLinkBatteryLevelSensor(ChildDataMixin, CoordinatorEntity, SensorEnti
 	@property
 	def available(self) -> bool:
 		"""Return True if entity is available."""
-		child_data = self._get_child_data()
-		if not (
-			self.coordinator.last_update_success
-			and child_data is not None
-			and "location" in child_data
-			and child_data["location"] is not None
-		):
+		if not self._has_key("location"):
 			return False
 
 		# Only available if we have battery data
-		return child_data["location"].get("battery_level") is not None
+		return self._get_child_data()["location"].get("battery_level") is not None
 
 	@property
 	def icon(self) -> str:
@@ -1371,27 +1090,12 @@ class FamilyLinkBatteryLevelSensor(ChildDataMixin, CoordinatorEntity, SensorEnti
 		if battery_level is None:
 			return "mdi:battery-unknown"
 
-		if battery_level >= 90:
-			return "mdi:battery"
-		elif battery_level >= 70:
-			return "mdi:battery-80"
-		elif battery_level >= 50:
-			return "mdi:battery-60"
-		elif battery_level >= 30:
-			return "mdi:battery-40"
-		elif battery_level >= 10:
-			return "mdi:battery-20"
-		else:
-			return "mdi:battery-alert-variant-outline"
+		return _BATTERY_ICONS[min(max(int(battery_level) // 10, 0), 9)]
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
+	def _compute_attributes(self) -> dict[str, Any]:
 		"""Return extra state attributes."""
 		child_data = self._get_child_data()
-		if not child_data or "location" not in child_data:
-			return {}
-
-		location = child_data["location"]
+		location = child_data.get("location") if child_data else None
 		if not location:
 			return {}
 
@@ -3,13 +3,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass
+from functools import partial
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -23,11 +27,29 @@ from .const import (
 	DOMAIN,
 	INTEGRATION_NAME,
 	LOGGER_NAME,
+	PENDING_STATE_DURATION,
 )
 from .coordinator import FamilyLinkDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
+# Device payload keys copied into the device switch attributes
+_DEVICE_ATTRIBUTES = (
+	("type", ATTR_DEVICE_TYPE),
+	("last_activity", ATTR_LAST_SEEN),
+	("locked", ATTR_LOCKED),
+	("model", "model"),
+)
+
+# Device switch icon for each restriction reason
+_DEVICE_ICONS = {
+	"manually_locked": "mdi:cellphone-lock",
+	"bonus_active": "mdi:cellphone-clock",
+	"bedtime_active": "mdi:cellphone-off",
+	"daily_limit_reached": "mdi:cellphone-remove",
+	"none": "mdi:cellphone",
+}
+
 
 async def async_setup_entry(
 	hass: HomeAssistant,
@@ -37,26 +59,24 @@ async def async_setup_entry(
 	"""Set up Family Link switch entities from a config entry."""
 	coordinator = hass.data[DOMAIN][entry.entry_id]
 
-	entities = []
+	def _iter_entities():
+		"""Yield switch entities for each child and their devices."""
+		for child_data in coordinator.data.get("children_data", []) if coordinator.data else []:
+			child_id = child_data["child_id"]
+			child_name = child_data["child_name"]
 
-	# Create switch entities for each child and their devices
-	for child_data in coordinator.data.get("children_data", []) if coordinator.data else []:
-		child_id = child_data["child_id"]
-		child_name = child_data["child_name"]
+			_LOGGER.debug("Creating switches for %s", child_name)
 
-		_LOGGER.debug(f"Creating switches for {child_name}")
+			# Create time limit control switches for this child
+			yield FamilyLinkBedtimeSwitch(coordinator, child_id, child_name)
+			yield FamilyLinkSchoolTimeSwitch(coordinator, child_id, child_name)
+			yield FamilyLinkDailyLimitSwitch(coordinator, child_id, child_name)
 
-		# Create time limit control switches for this child
-		entities.append(FamilyLinkBedtimeSwitch(coordinator, child_id, child_name))
-		entities.append(FamilyLinkSchoolTimeSwitch(coordinator, child_id, child_name))
-		entities.append(FamilyLinkDailyLimitSwitch(coordinator, child_id, child_name))
+			# Create device lock/unlock switches for each device
+			for device in child_data.get("devices", []):
+				yield FamilyLinkDeviceSwitch(coordinator, device, child_id, child_name)
 
-		# Create device lock/unlock switches for each device
-		for device in child_data.get("devices", []):
-			entities.append(FamilyLinkDeviceSwitch(coordinator, device, child_id, child_name))
-
-	_LOGGER.debug(f"Created {len(entities)} total switch entities")
-	async_add_entities(entities, update_before_add=True)
+	async_add_entities(_iter_entities())
 
 
 class FamilyLinkDeviceSwitch(CoordinatorEntity, SwitchEntity):
@@ -78,98 +98,72 @@ class FamilyLinkDeviceSwitch(CoordinatorEntity, SwitchEntity):
 		self._child_name = child_name
 		self._attr_name = device.get("name", f"{child_name} Device {self._device_id}")
 		self._attr_unique_id = f"{DOMAIN}_{child_id}_{self._device_id}"
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, f"{child_id}_{self._device_id}")},
+			name=self._attr_name,
+			manufacturer="Google",
+			model=device.get("model", "Family Link Device"),
+			sw_version=device.get("version"),
+			via_device=(DOMAIN, child_id),  # Link to parent (child's account device)
+		)
+		# Payload slices the current state was built from; the coordinator
+		# replaces them on refresh, so identity tells whether they changed.
+		self._state_device: dict[str, Any] | None = None
+		self._state_time_data: dict[str, Any] | None = None
+		# Availability as of the last write; the coordinator has already
+		# updated last_update_success by the time listeners are called.
+		self._last_available = self.available
+		self._refresh_state()
 
 	def _get_device_time_data(self) -> dict[str, Any] | None:
 		"""Get time data for this device."""
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					devices_time_data = child_data.get("devices_time_data", {})
-					return devices_time_data.get(self._device_id)
-		return None
+		data = self.coordinator.data
+		if not data:
+			return None
+		return data.get("time_data_by_ids", {}).get((self._child_id, self._device_id))
 
 	def _get_current_device(self) -> dict[str, Any] | None:
 		"""Get current device data."""
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					for device in child_data.get("devices", []):
-						if device["id"] == self._device_id:
-							return device
+		data = self.coordinator.data
+		child_data = data.get("children_by_id", {}).get(self._child_id) if data else None
+		if child_data is not None:
+			device = child_data.get("devices_by_id", {}).get(self._device_id)
+			if device is not None:
+				return device
 		return self._device
 
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, f"{self._child_id}_{self._device_id}")},
-			name=self._attr_name,
-			manufacturer="Google",
-			model=self._device.get("model", "Family Link Device"),
-			sw_version=self._device.get("version"),
-			via_device=(DOMAIN, self._child_id),  # Link to parent (child's account device)
-		)
-
-	@property
-	def is_on(self) -> bool:
-		"""Return True if device is usable (not restricted)."""
-		device = self._get_current_device()
-		if not device:
-			return True
-
-		# If manually locked, always OFF
-		if device.get("locked", False):
-			return False
-
-		# Get time restrictions
-		time_data = self._get_device_time_data()
-		if time_data:
-			bedtime_active = time_data.get("bedtime_active", False)
-			daily_limit_remaining = time_data.get("daily_limit_remaining", 1)
-			bonus_active = time_data.get("bonus_minutes", 0) > 0
-
-			# If bonus is active, device is usable regardless of other restrictions
-			if bonus_active:
-				return True
-
-			# If restrictions active and no bonus, device is not usable
-			if bedtime_active or daily_limit_remaining <= 0:
-				return False
-
-		# No restrictions, device is usable
-		return True
-
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
-
-	@property
-	def icon(self) -> str:
-		"""Return dynamic icon based on device state."""
+	def _refresh_state(self) -> None:
+		"""Recompute state, icon and attributes from coordinator data."""
 		device = self._get_current_device()
 		time_data = self._get_device_time_data()
+		if device is self._state_device and time_data is self._state_time_data:
+			return
+		self._state_device = device
+		self._state_time_data = time_data
 
-		if device and device.get("locked", False):
-			return "mdi:cellphone-lock"
-
+		locked = bool(device and device.get("locked", False))
+		bonus_active = bedtime_active = daily_limit_reached = False
 		if time_data:
 			bonus_active = time_data.get("bonus_minutes", 0) > 0
 			bedtime_active = time_data.get("bedtime_active", False)
-			daily_limit_remaining = time_data.get("daily_limit_remaining", 1)
-
-			if bonus_active:
-				return "mdi:cellphone-clock"  # Bonus active
-			if bedtime_active:
-				return "mdi:cellphone-off"  # Bedtime
-			if daily_limit_remaining <= 0:
-				return "mdi:cellphone-remove"  # Daily limit reached
+			daily_limit_reached = time_data.get("daily_limit_remaining", 1) <= 0
+
+		# A manual lock always wins; otherwise an active bonus makes the
+		# device usable regardless of bedtime or the daily limit.
+		if locked:
+			reason = "manually_locked"
+		elif bonus_active:
+			reason = "bonus_active"
+		elif bedtime_active:
+			reason = "bedtime_active"
+		elif daily_limit_reached:
+			reason = "daily_limit_reached"
+		else:
+			reason = "none"
 
-		return "mdi:cellphone"  # Normal/usable
+		self._attr_is_on = reason in ("bonus_active", "none")
+		self._attr_icon = _DEVICE_ICONS[reason]
 
-	@property
-	def extra_state_attributes(self) -> dict[str, Any]:
-		"""Return extra state attributes including restriction info."""
 		attributes = {
 			ATTR_DEVICE_ID: self._device_id,
 			ATTR_DEVICE_NAME: self._attr_name,
@@ -177,43 +171,33 @@ class FamilyLinkDeviceSwitch(CoordinatorEntity, SwitchEntity):
 			"child_name": self._child_name,
 		}
 
-		# Get device data
-		device = self._get_current_device()
 		if device:
-			if "type" in device:
-				attributes[ATTR_DEVICE_TYPE] = device["type"]
-			if "last_activity" in device:
-				attributes[ATTR_LAST_SEEN] = device["last_activity"]
-			if "locked" in device:
-				attributes[ATTR_LOCKED] = device["locked"]
-			if "model" in device:
-				attributes["model"] = device["model"]
-
-		# Get time restrictions
-		time_data = self._get_device_time_data()
+			attributes.update(
+				(attr, device[key]) for key, attr in _DEVICE_ATTRIBUTES if key in device
+			)
+
 		if time_data:
-			attributes["bedtime_active"] = time_data.get("bedtime_active", False)
+			attributes["bedtime_active"] = bedtime_active
 			attributes["school_time_active"] = time_data.get("schooltime_active", False)
-			attributes["daily_limit_reached"] = time_data.get("daily_limit_remaining", 1) <= 0
-			attributes["bonus_active"] = time_data.get("bonus_minutes", 0) > 0
+			attributes["daily_limit_reached"] = daily_limit_reached
+			attributes["bonus_active"] = bonus_active
 			attributes["bonus_minutes"] = time_data.get("bonus_minutes", 0)
 			attributes["remaining_minutes"] = time_data.get("remaining_minutes", 0)
+			attributes["restriction_reason"] = reason
+
+		self._attr_extra_state_attributes = attributes
+
+	@callback
+	def _handle_coordinator_update(self) -> None:
+		"""Rebuild state, writing it only if something this switch shows changed."""
+		previous = (self._last_available, self._attr_extra_state_attributes)
+		self._refresh_state()
+		self._last_available = self.available
+		if (self._last_available, self._attr_extra_state_attributes) == previous:
+			return
+		super()._handle_coordinator_update()
 
-			# Add restriction reason
-			if device and device.get("locked", False):
-				attributes["restriction_reason"] = "manually_locked"
-			elif time_data.get("bonus_minutes", 0) > 0:
-				attributes["restriction_reason"] = "bonus_active"
-			elif time_data.get("bedtime_active", False):
-				attributes["restriction_reason"] = "bedtime_active"
-			elif time_data.get("daily_limit_remaining", 1) <= 0:
-				attributes["restriction_reason"] = "daily_limit_reached"
-			else:
-				attributes["restriction_reason"] = "none"
-
-		return attributes
-
-	async def async_turn_on(self) -> None:
+	async def async_turn_on(self, **kwargs: Any) -> None:
 		"""Unlock device (bypass restrictions without disabling bedtime/daily_limit)."""
 		_LOGGER.info("Unlocking device %s for child %s (bypass restrictions)", self._device_id, self._child_name)
 
@@ -227,7 +211,7 @@ class FamilyLinkDeviceSwitch(CoordinatorEntity, SwitchEntity):
 		else:
 			_LOGGER.info("Successfully unlocked device %s", self._device_id)
 
-	async def async_turn_off(self) -> None:
+	async def async_turn_off(self, **kwargs: Any) -> None:
 		"""Lock device (cancel bonus if active, then lock)."""
 		if self.coordinator.client is None:
 			_LOGGER.error("Cannot lock device: client not connected")
@@ -262,114 +246,37 @@ class FamilyLinkDeviceSwitch(CoordinatorEntity, SwitchEntity):
 			_LOGGER.info("Successfully locked device %s", self._device_id)
 
 
-class FamilyLinkBedtimeSwitch(CoordinatorEntity, SwitchEntity):
-	"""Representation of bedtime (downtime) control as a switch."""
-
-	def __init__(
-		self,
-		coordinator: FamilyLinkDataUpdateCoordinator,
-		child_id: str,
-		child_name: str,
-	) -> None:
-		"""Initialize the switch."""
-		super().__init__(coordinator)
-
-		self._child_id = child_id
-		self._child_name = child_name
-		self._attr_name = f"{child_name} Bedtime"
-		self._attr_unique_id = f"{DOMAIN}_{child_id}_bedtime"
-		self._attr_entity_category = EntityCategory.CONFIG
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, self._child_id)},
-			name=f"{self._child_name} (Family Link)",
-			manufacturer="Google",
-			model="Family Link Account",
-		)
-
-	@property
-	def is_on(self) -> bool:
-		"""Return True if bedtime is enabled for today.
-
-		Reads the effective state from appliedTimeLimits rather than the
-		weekly revision, so that daily overrides (issue #114) are honored.
-		Falls back to the weekly revision if the today-effective field is
-		not populated (e.g. first refresh before appliedTimeLimits returns).
-		"""
-		# Check for pending state first (takes precedence for 5 seconds after change)
-		pending_state = self.coordinator.get_pending_time_limit_state(self._child_id, "bedtime")
-		if pending_state is not None:
-			return pending_state
-
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					today = child_data.get("bedtime_enabled_today")
-					if today is not None:
-						return today
-					weekly = child_data.get("bedtime_enabled")
-					if weekly is not None:
-						return weekly
-		return False
-
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
-
-	@property
-	def icon(self) -> str:
-		"""Return the icon for the switch."""
-		return "mdi:sleep" if self.is_on else "mdi:sleep-off"
-
-	async def async_turn_on(self) -> None:
-		"""Enable bedtime."""
-		if self.coordinator.client is None:
-			_LOGGER.error("Cannot enable bedtime: client not connected")
-			return
-		_LOGGER.debug("Enabling bedtime for child %s", self._child_name)
-
-		# Set pending state immediately for instant UI feedback
-		self.coordinator.set_pending_time_limit_state(self._child_id, "bedtime", True)
-		self.async_write_ha_state()
-
-		success = await self.coordinator.client.async_enable_bedtime(account_id=self._child_id)
-
-		if not success:
-			_LOGGER.error("Failed to enable bedtime for %s", self._child_name)
-			self.coordinator.set_pending_time_limit_state(self._child_id, "bedtime", None)
-			self.async_write_ha_state()
-		else:
-			_LOGGER.info("Successfully enabled bedtime for %s", self._child_name)
-			await self.coordinator.async_request_refresh()
+@dataclass(frozen=True)
+class TimeLimitSpec:
+	"""Describe one child-level time limit exposed as a switch."""
 
-	async def async_turn_off(self) -> None:
-		"""Disable bedtime."""
-		if self.coordinator.client is None:
-			_LOGGER.error("Cannot disable bedtime: client not connected")
-			return
-		_LOGGER.debug("Disabling bedtime for child %s", self._child_name)
+	limit_type: str  # pending-state key and client method suffix
+	label: str  # used in names and log messages
+	state_key: str  # child data field with the effective (today) state
+	fallback_key: str | None  # field read when state_key is not populated
+	icon_on: str
+	icon_off: str
 
-		# Set pending state immediately for instant UI feedback
-		self.coordinator.set_pending_time_limit_state(self._child_id, "bedtime", False)
-		self.async_write_ha_state()
 
-		success = await self.coordinator.client.async_disable_bedtime(account_id=self._child_id)
+# Bedtime and school time read the effective state from appliedTimeLimits
+# rather than the weekly revision, so that daily overrides (issue #114) are
+# honored, and fall back to the weekly revision if the today-effective field
+# is not populated (e.g. first refresh before appliedTimeLimits returns).
+BEDTIME_SPEC = TimeLimitSpec(
+	"bedtime", "Bedtime", "bedtime_enabled_today", "bedtime_enabled", "mdi:sleep", "mdi:sleep-off"
+)
+SCHOOL_TIME_SPEC = TimeLimitSpec(
+	"school_time", "School Time", "school_time_enabled_today", "school_time_enabled", "mdi:school", "mdi:school-outline"
+)
+DAILY_LIMIT_SPEC = TimeLimitSpec(
+	"daily_limit", "Daily Limit", "daily_limit_enabled", None, "mdi:timer", "mdi:timer-off"
+)
 
-		if not success:
-			_LOGGER.error("Failed to disable bedtime for %s", self._child_name)
-			self.coordinator.set_pending_time_limit_state(self._child_id, "bedtime", None)
-			self.async_write_ha_state()
-		else:
-			_LOGGER.info("Successfully disabled bedtime for %s", self._child_name)
-			await self.coordinator.async_request_refresh()
 
+class FamilyLinkTimeLimitSwitch(CoordinatorEntity, SwitchEntity):
+	"""Representation of a child's time limit control as a switch."""
 
-class FamilyLinkSchoolTimeSwitch(CoordinatorEntity, SwitchEntity):
-	"""Representation of school time (evening limit) control as a switch."""
+	_spec: TimeLimitSpec
 
 	def __init__(
 		self,
@@ -380,190 +287,158 @@ class FamilyLinkSchoolTimeSwitch(CoordinatorEntity, SwitchEntity):
 		"""Initialize the switch."""
 		super().__init__(coordinator)
 
+		spec = self._spec
 		self._child_id = child_id
 		self._child_name = child_name
-		self._attr_name = f"{child_name} School Time"
-		self._attr_unique_id = f"{DOMAIN}_{child_id}_school_time"
+		self._attr_name = f"{child_name} {spec.label}"
+		self._attr_unique_id = f"{DOMAIN}_{child_id}_{spec.limit_type}"
 		self._attr_entity_category = EntityCategory.CONFIG
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, self._child_id)},
-			name=f"{self._child_name} (Family Link)",
+		self._attr_device_info = DeviceInfo(
+			identifiers={(DOMAIN, child_id)},
+			name=f"{child_name} (Family Link)",
 			manufacturer="Google",
 			model="Family Link Account",
 		)
-
-	@property
-	def is_on(self) -> bool:
-		"""Return True if school time is enabled for today.
-
-		Reads the effective state from appliedTimeLimits rather than the
-		weekly revision, so that daily overrides (issue #114) are honored.
-		Falls back to the weekly revision if the today-effective field is
-		not populated.
+		self._label = spec.label.lower()
+		# Cancels the timer that drops this switch's pending state
+		self._cancel_pending_expiry: Callable[[], None] | None = None
+		# Availability as of the last write (see FamilyLinkDeviceSwitch)
+		self._last_available = self.available
+		self._refresh_state()
+
+	async def async_added_to_hass(self) -> None:
+		"""Cancel a pending-state timer when the entity is removed."""
+		await super().async_added_to_hass()
+		self.async_on_remove(self._async_cancel_pending_expiry)
+
+	@callback
+	def _async_cancel_pending_expiry(self) -> None:
+		"""Cancel the pending-state timer, if any."""
+		if self._cancel_pending_expiry is not None:
+			self._cancel_pending_expiry()
+			self._cancel_pending_expiry = None
+
+	@callback
+	def _async_set_pending(self, enabled: bool | None) -> None:
+		"""Set (or clear) this switch's pending state and show it right away.
+
+		Unchanged polls no longer notify the switches, so a set state is
+		dropped by a timer of its own, replaced on every new request.
 		"""
-		# Check for pending state first (takes precedence for 5 seconds after change)
-		pending_state = self.coordinator.get_pending_time_limit_state(self._child_id, "school_time")
+		self._async_cancel_pending_expiry()
+		self.coordinator.set_pending_time_limit_state(self._child_id, self._spec.limit_type, enabled)
+		if enabled is not None:
+			self._cancel_pending_expiry = async_call_later(
+				self.hass, PENDING_STATE_DURATION, self._async_pending_expired
+			)
+		self._handle_coordinator_update()
+
+	@callback
+	def _async_pending_expired(self, _now: Any) -> None:
+		"""Drop the pending state and fall back to the coordinator data."""
+		self._cancel_pending_expiry = None
+		self._async_set_pending(None)
+
+	def _refresh_state(self) -> None:
+		"""Recompute state and icon from coordinator data."""
+		self._attr_is_on = self._compute_is_on()
+		self._attr_icon = self._spec.icon_on if self._attr_is_on else self._spec.icon_off
+
+	@callback
+	def _handle_coordinator_update(self) -> None:
+		"""Rebuild state, writing it only if the switch state changed."""
+		previous = (self._last_available, self._attr_is_on)
+		self._refresh_state()
+		self._last_available = self.available
+		if (self._last_available, self._attr_is_on) == previous:
+			return
+		super()._handle_coordinator_update()
+
+	def _compute_is_on(self) -> bool:
+		"""Return True if the time limit is enabled (for today)."""
+		# Check for pending state first (takes precedence for a few seconds after change)
+		pending_state = self.coordinator.get_pending_time_limit_state(self._child_id, self._spec.limit_type)
 		if pending_state is not None:
 			return pending_state
 
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					today = child_data.get("school_time_enabled_today")
-					if today is not None:
-						return today
-					weekly = child_data.get("school_time_enabled")
-					if weekly is not None:
-						return weekly
+		data = self.coordinator.data
+		child_data = data.get("children_by_id", {}).get(self._child_id) if data else None
+		if child_data is not None:
+			state = child_data.get(self._spec.state_key)
+			if state is not None:
+				return state
+			if self._spec.fallback_key is not None:
+				fallback = child_data.get(self._spec.fallback_key)
+				if fallback is not None:
+					return fallback
+		# Default to False if unknown
 		return False
 
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
+	async def async_turn_on(self, **kwargs: Any) -> None:
+		"""Enable the time limit."""
+		await self._async_request_enabled(True)
 
-	@property
-	def icon(self) -> str:
-		"""Return the icon for the switch."""
-		return "mdi:school" if self.is_on else "mdi:school-outline"
+	async def async_turn_off(self, **kwargs: Any) -> None:
+		"""Disable the time limit."""
+		await self._async_request_enabled(False)
 
-	async def async_turn_on(self) -> None:
-		"""Enable school time."""
+	async def _async_request_enabled(self, enabled: bool) -> None:
+		"""Show the requested state right away and queue the API call."""
 		if self.coordinator.client is None:
-			_LOGGER.error("Cannot enable school time: client not connected")
+			_LOGGER.error("Cannot %s %s: client not connected", "enable" if enabled else "disable", self._label)
 			return
-		_LOGGER.debug("Enabling school time for child %s", self._child_name)
-
-		self.coordinator.set_pending_time_limit_state(self._child_id, "school_time", True)
-		self.async_write_ha_state()
-
-		success = await self.coordinator.client.async_enable_school_time(account_id=self._child_id)
+		_LOGGER.debug("%s %s for child %s", "Enabling" if enabled else "Disabling", self._label, self._child_name)
 
-		if not success:
-			_LOGGER.error("Failed to enable school time for %s", self._child_name)
-			self.coordinator.set_pending_time_limit_state(self._child_id, "school_time", None)
-			self.async_write_ha_state()
-		else:
-			_LOGGER.info("Successfully enabled school time for %s", self._child_name)
-			await self.coordinator.async_request_refresh()
+		# Set pending state immediately for instant UI feedback
+		self._async_set_pending(enabled)
+
+		# Run the API call behind this child's other changes and wait for it.
+		# A request still waiting in the queue is replaced by this one and
+		# shares its future, so shield it from this caller's cancellation.
+		await asyncio.shield(
+			self.coordinator.async_enqueue_child_op(
+				self._child_id, partial(self._async_send_state, enabled), key=self._spec.limit_type
+			)
+		)
 
-	async def async_turn_off(self) -> None:
-		"""Disable school time."""
-		if self.coordinator.client is None:
-			_LOGGER.error("Cannot disable school time: client not connected")
-			return
-		_LOGGER.debug("Disabling school time for child %s", self._child_name)
+	async def _async_send_state(self, is_on: bool) -> bool:
+		"""Send a time limit state to Family Link.
 
-		self.coordinator.set_pending_time_limit_state(self._child_id, "school_time", False)
-		self.async_write_ha_state()
+		Returns False if the call failed or the coordinator data could not
+		be updated in place, so that a refresh is requested.
+		"""
+		client = self.coordinator.client
+		if client is None:
+			_LOGGER.error("Cannot update %s: client not connected", self._label)
+			return False
 
-		success = await self.coordinator.client.async_disable_school_time(account_id=self._child_id)
+		action = "enable" if is_on else "disable"
+		method = getattr(client, f"async_{action}_{self._spec.limit_type}")
+		success = await method(account_id=self._child_id)
 
 		if not success:
-			_LOGGER.error("Failed to disable school time for %s", self._child_name)
-			self.coordinator.set_pending_time_limit_state(self._child_id, "school_time", None)
-			self.async_write_ha_state()
-		else:
-			_LOGGER.info("Successfully disabled school time for %s", self._child_name)
-			await self.coordinator.async_request_refresh()
-
-
-class FamilyLinkDailyLimitSwitch(CoordinatorEntity, SwitchEntity):
-	"""Representation of daily limit control as a switch."""
-
-	def __init__(
-		self,
-		coordinator: FamilyLinkDataUpdateCoordinator,
-		child_id: str,
-		child_name: str,
-	) -> None:
-		"""Initialize the switch."""
-		super().__init__(coordinator)
-
-		self._child_id = child_id
-		self._child_name = child_name
-		self._attr_name = f"{child_name} Daily Limit"
-		self._attr_unique_id = f"{DOMAIN}_{child_id}_daily_limit"
-		self._attr_entity_category = EntityCategory.CONFIG
-
-	@property
-	def device_info(self) -> DeviceInfo:
-		"""Return device information."""
-		return DeviceInfo(
-			identifiers={(DOMAIN, self._child_id)},
-			name=f"{self._child_name} (Family Link)",
-			manufacturer="Google",
-			model="Family Link Account",
-		)
-
-	@property
-	def is_on(self) -> bool:
-		"""Return True if daily limit is enabled."""
-		# Check for pending state first (takes precedence for 5 seconds after change)
-		pending_state = self.coordinator.get_pending_time_limit_state(self._child_id, "daily_limit")
-		if pending_state is not None:
-			return pending_state
-
-		# Otherwise use actual state from API (read from time limit configuration)
-		if self.coordinator.data and "children_data" in self.coordinator.data:
-			for child_data in self.coordinator.data["children_data"]:
-				if child_data["child_id"] == self._child_id:
-					daily_limit_enabled = child_data.get("daily_limit_enabled")
-					if daily_limit_enabled is not None:
-						return daily_limit_enabled
-		# Default to False if unknown
-		return False
+			_LOGGER.error("Failed to %s %s for %s", action, self._label, self._child_name)
+			self._async_set_pending(None)
+			return False
 
-	@property
-	def available(self) -> bool:
-		"""Return True if entity is available."""
-		return self.coordinator.last_update_success
+		_LOGGER.info("Successfully %sd %s for %s", action, self._label, self._child_name)
+		# Reflect the change right away; the next scheduled poll reconciles
+		return self.coordinator.apply_time_limit_state(self._child_id, self._spec.limit_type, is_on)
 
-	@property
-	def icon(self) -> str:
-		"""Return the icon for the switch."""
-		return "mdi:timer" if self.is_on else "mdi:timer-off"
 
-	async def async_turn_on(self) -> None:
-		"""Enable daily limit."""
-		if self.coordinator.client is None:
-			_LOGGER.error("Cannot enable daily limit: client not connected")
-			return
-		_LOGGER.debug("Enabling daily limit for child %s", self._child_name)
+class FamilyLinkBedtimeSwitch(FamilyLinkTimeLimitSwitch):
+	"""Representation of bedtime (downtime) control as a switch."""
 
-		self.coordinator.set_pending_time_limit_state(self._child_id, "daily_limit", True)
-		self.async_write_ha_state()
+	_spec = BEDTIME_SPEC
 
-		success = await self.coordinator.client.async_enable_daily_limit(account_id=self._child_id)
 
-		if not success:
-			_LOGGER.error("Failed to enable daily limit for %s", self._child_name)
-			self.coordinator.set_pending_time_limit_state(self._child_id, "daily_limit", None)
-			self.async_write_ha_state()
-		else:
-			_LOGGER.info("Successfully enabled daily limit for %s", self._child_name)
-			await self.coordinator.async_request_refresh()
+class FamilyLinkSchoolTimeSwitch(FamilyLinkTimeLimitSwitch):
+	"""Representation of school time (evening limit) control as a switch."""
 
-	async def async_turn_off(self) -> None:
-		"""Disable daily limit."""
-		if self.coordinator.client is None:
-			_LOGGER.error("Cannot disable daily limit: client not connected")
-			return
-		_LOGGER.debug("Disabling daily limit for child %s", self._child_name)
+	_spec = SCHOOL_TIME_SPEC
 
-		self.coordinator.set_pending_time_limit_state(self._child_id, "daily_limit", False)
-		self.async_write_ha_state()
 
-		success = await self.coordinator.client.async_disable_daily_limit(account_id=self._child_id)
+class FamilyLinkDailyLimitSwitch(FamilyLinkTimeLimitSwitch):
+	"""Representation of daily limit control as a switch."""
 
-		if not success:
-			_LOGGER.error("Failed to disable daily limit for %s", self._child_name)
-			self.coordinator.set_pending_time_limit_state(self._child_id, "daily_limit", None)
-			self.async_write_ha_state()
-		else:
-			_LOGGER.info("Successfully disabled daily limit for %s", self._child_name)
-			await self.coordinator.async_request_refresh()
\ No newline at end of file
+	_spec = DAILY_LIMIT_SPEC
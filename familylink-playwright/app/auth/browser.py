@@ -7,15 +7,34 @@ from typing import Dict, Optional
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
+from app.storage.file_storage import SharedStorage
+
 _LOGGER = logging.getLogger(__name__)
 
+# The SID/HSID/... session cookies are set on .google.com, so they are all
+# returned for this URL
+_GOOGLE_AUTH_COOKIE_URL = 'https://accounts.google.com/'
+
+# Pages that are only reachable once the user has signed in
+_SIGNED_IN_DOMAINS = ('families.google.com', 'myaccount.google.com')
+
+
+def _is_signed_in_url(url: str) -> bool:
+    """Return True if the URL is past the Google login pages."""
+    return 'accounts.google.com' not in url and any(domain in url for domain in _SIGNED_IN_DOMAINS)
+
+
+def _is_google_domain(domain: str) -> bool:
+    """Return True for google.com and its subdomains (cookie domain)."""
+    return domain == 'google.com' or domain.endswith('.google.com')
+
 
 class BrowserAuthManager:
     """Manages browser-based authentication sessions."""
 
     MAX_CONCURRENT_SESSIONS = 1
 
-    def __init__(self, auth_timeout: int = 300, language: str = "en-US", timezone: str = "Europe/Paris", storage=None):
+    def __init__(self, storage: SharedStorage, auth_timeout: int = 300, language: str = "en-US", timezone: str = "Europe/Paris"):
         """Initialize browser auth manager."""
         self._sessions: Dict[str, Dict] = {}
         self._monitor_tasks: Dict[str, asyncio.Task] = {}
@@ -23,7 +42,7 @@ class BrowserAuthManager:
         self._auth_timeout = auth_timeout
         self._language = language
         self._timezone = timezone
-        self._storage = storage  # Injected SharedStorage instance
+        self._storage = storage  # Shared with main.py so both see the same cookie cache
 
     async def initialize(self):
         """Initialize Playwright."""
@@ -187,47 +206,45 @@ class BrowserAuthManager:
 
                 # Log URL changes at INFO, repeated polls at DEBUG
                 if current_url != last_url:
-                    _LOGGER.info(f"URL changed to: {current_url}")
+                    _LOGGER.info("URL changed to: %s", current_url)
                     last_url = current_url
                 else:
-                    _LOGGER.debug(f"Polling - URL unchanged")
+                    _LOGGER.debug("Polling - URL unchanged")
 
                 # Method 1: URL-based detection
                 # Check if we're past the login page
-                if 'accounts.google.com' not in current_url:
-                    if any(domain in current_url for domain in [
-                        'families.google.com',
-                        'myaccount.google.com',
-                    ]):
-                        _LOGGER.info(f"Authentication detected via URL: {current_url}")
-
-                        # Navigate to families.google.com to ensure cookies are properly configured
-                        _LOGGER.info("Navigating to families.google.com to finalize cookie configuration...")
-                        try:
-                            await page.goto('https://families.google.com/families/', wait_until='load', timeout=15000)
-                            _LOGGER.info("Successfully navigated to families.google.com")
-                            await asyncio.sleep(2)
-                        except Exception as e:
-                            _LOGGER.warning(f"Failed to navigate to families.google.com: {e}")
+                if _is_signed_in_url(current_url):
+                    _LOGGER.info("Authentication detected via URL: %s", current_url)
 
-                        authenticated = True
-                        break
+                    # Navigate to families.google.com to ensure cookies are properly configured
+                    _LOGGER.info("Navigating to families.google.com to finalize cookie configuration...")
+                    try:
+                        await page.goto('https://families.google.com/families/', wait_until='load', timeout=15000)
+                        _LOGGER.info("Successfully navigated to families.google.com")
+                        await asyncio.sleep(2)
+                    except Exception as e:
+                        _LOGGER.warning("Failed to navigate to families.google.com: %s", e)
+
+                    authenticated = True
+                    break
 
                 # Method 2: Cookie-based detection (fallback)
                 # Google sets auth cookies (SID, HSID, etc.) after successful login
                 # even before the URL redirect completes
                 try:
-                    cookies = await context.cookies()
+                    # Only fetch what would be sent to Google, not every
+                    # third-party cookie the login pages picked up
+                    cookies = await context.cookies(_GOOGLE_AUTH_COOKIE_URL)
                     google_auth_cookies = [
                         c for c in cookies
                         if c.get('name') in GOOGLE_AUTH_COOKIE_NAMES
-                        and '.google.com' in c.get('domain', '')
+                        and _is_google_domain(c.get('domain', ''))
                     ]
                     if len(google_auth_cookies) >= 3:
                         _LOGGER.info(
-                            f"Authentication detected via cookies "
-                            f"({len(google_auth_cookies)} auth cookies found: "
-                            f"{[c['name'] for c in google_auth_cookies]})"
+                            "Authentication detected via cookies (%d auth cookies found: %s)",
+                            len(google_auth_cookies),
+                            [c['name'] for c in google_auth_cookies],
                         )
 
                         # Navigate to families.google.com to finalize cookies
@@ -237,14 +254,23 @@ class BrowserAuthManager:
                             _LOGGER.info("Successfully navigated to families.google.com")
                             await asyncio.sleep(2)
                         except Exception as e:
-                            _LOGGER.warning(f"Failed to navigate to families.google.com: {e}")
+                            _LOGGER.warning("Failed to navigate to families.google.com: %s", e)
 
                         authenticated = True
                         break
                 except Exception as e:
-                    _LOGGER.debug(f"Cookie check failed: {e}")
+                    _LOGGER.debug("Cookie check failed: %s", e)
 
-                await asyncio.sleep(2)  # Check every 2 seconds
+                # Wake up as soon as the page navigates past the login, but
+                # at least every 2 seconds so the cookie check above still runs
+                try:
+                    await page.wait_for_url(_is_signed_in_url, timeout=2000)
+                except PlaywrightTimeoutError:
+                    pass
+                except Exception as e:
+                    # e.g. the page was closed or replaced by a new tab
+                    _LOGGER.debug("Waiting for navigation failed: %s", e)
+                    await asyncio.sleep(2)
 
             if not authenticated:
                 raise asyncio.TimeoutError("Authentication timeout")
@@ -254,25 +280,15 @@ class BrowserAuthManager:
             cookies = await context.cookies()
 
             # Filter relevant Google cookies
-            google_cookies = [
-                c for c in cookies
-                if any(domain in c.get('domain', '') for domain in [
-                    'google.com', 'families.google.com', 'accounts.google.com'
-                ])
-            ]
+            google_cookies = [c for c in cookies if _is_google_domain(c.get('domain', ''))]
 
             if not google_cookies:
                 raise Exception("No valid Google cookies found")
 
             _LOGGER.info(f"Extracted {len(google_cookies)} Google cookies")
 
-            # Save to shared storage (use injected instance to avoid config mismatch)
-            if self._storage:
-                await self._storage.save_cookies(google_cookies)
-            else:
-                from app.storage.file_storage import SharedStorage
-                storage = SharedStorage()
-                await storage.save_cookies(google_cookies)
+            # Save to shared storage
+            await self._storage.save_cookies(google_cookies)
 
             # Update session
             session['status'] = 'completed'
@@ -360,6 +376,12 @@ class BrowserAuthManager:
     async def cleanup(self):
         """Cleanup all resources."""
         _LOGGER.info("Cleaning up all sessions...")
+        # Stop monitors first so they don't keep driving pages being closed
+        tasks = list(self._monitor_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
         for session_id in list(self._sessions.keys()):
             await self._cleanup_session(session_id)
 
@@ -1,5 +1,6 @@
 """Configuration management for the add-on."""
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel
 
@@ -34,8 +35,9 @@ def _safe_int(value: str, default: int) -> int:
         return default
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get configuration from environment variables."""
+    """Get configuration from environment variables (read once per process)."""
     return Config(
         log_level=os.getenv("LOG_LEVEL", "info"),
         auth_timeout=_safe_int(os.getenv("AUTH_TIMEOUT", "300"), 300),
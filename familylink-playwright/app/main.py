@@ -1,13 +1,14 @@
 """Main FastAPI application for Family Link Auth."""
+import json
 import logging
 import os
 import secrets
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Request
-from fastapi.responses import HTMLResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
@@ -26,11 +27,44 @@ logging.basicConfig(
 
 _LOGGER = logging.getLogger(__name__)
 
+# Global instances
+storage = SharedStorage(config.share_dir)
+browser_manager = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and clean them up on shutdown."""
+    global browser_manager
+    _LOGGER.info("Starting Family Link Auth Service v1.6.0")
+    _LOGGER.info(f"Configuration: log_level={config.log_level}, auth_timeout={config.auth_timeout}s")
+
+    try:
+        browser_manager = BrowserAuthManager(
+            storage=storage,
+            auth_timeout=config.auth_timeout,
+            language=config.language,
+            timezone=config.timezone,
+        )
+        await browser_manager.initialize()
+        _LOGGER.info("Service started successfully")
+    except Exception as e:
+        _LOGGER.error(f"Failed to start service: {e}")
+        raise
+
+    yield
+
+    _LOGGER.info("Shutting down Family Link Auth Service")
+    if browser_manager:
+        await browser_manager.cleanup()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Google Family Link Auth Service",
     description="Authentication service for Google Family Link integration",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration — restrict to local HA origins
@@ -55,11 +89,6 @@ _API_KEY = os.getenv("API_KEY", "")
 # shared volume, so an auto-generated key would break the integration.
 _ADDON_MODE = bool(os.getenv("SUPERVISOR_TOKEN") or os.getenv("ADDON_MODE"))
 
-# Global instances
-storage = SharedStorage(config.share_dir)
-browser_manager = None
-
-
 def _load_or_create_cookie_api_key() -> "str | None":
     """Return the cookie-endpoint key, or None when intentionally left open.
 
@@ -118,38 +147,8 @@ def _verify_cookie_api_key(request: Request):
     _check_key(request, _COOKIE_API_KEY)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup."""
-    global browser_manager
-    _LOGGER.info("Starting Family Link Auth Service v1.6.0")
-    _LOGGER.info(f"Configuration: log_level={config.log_level}, auth_timeout={config.auth_timeout}s")
-
-    try:
-        browser_manager = BrowserAuthManager(
-            auth_timeout=config.auth_timeout,
-            language=config.language,
-            timezone=config.timezone,
-            storage=storage,
-        )
-        await browser_manager.initialize()
-        _LOGGER.info("Service started successfully")
-    except Exception as e:
-        _LOGGER.error(f"Failed to start service: {e}")
-        raise
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    _LOGGER.info("Shutting down Family Link Auth Service")
-    if browser_manager:
-        await browser_manager.cleanup()
-
-
-@app.get("/", response_class=HTMLResponse)
-async def index():
-    """Serve the main authentication interface."""
+def _render_index() -> str:
+    """Render the main authentication interface."""
     t = get_translations(config.language)
     # Only embed the VNC password in the page when it is still the documented
     # default — never leak a custom password on this unauthenticated page.
@@ -493,17 +492,31 @@ async def index():
 </body>
 </html>
     """
-    return HTMLResponse(content=html_content)
+    return html_content
+
+
+# The page only depends on start-up configuration, so render and encode it once
+_INDEX_HTML = _render_index().encode("utf-8")
+
+
+@app.get("/", response_class=HTMLResponse)
+async def index():
+    """Serve the main authentication interface."""
+    return HTMLResponse(content=_INDEX_HTML)
+
+
+# Constant payload, encoded once instead of serialized on every probe
+_HEALTH_JSON = json.dumps({
+    "status": "healthy",
+    "service": "familylink-auth",
+    "version": "1.0.0"
+}, separators=(",", ":")).encode("utf-8")
 
 
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "familylink-auth",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 
 @app.post("/api/auth/start")
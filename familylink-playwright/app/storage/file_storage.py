@@ -3,7 +3,7 @@ import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from cryptography.fernet import Fernet, InvalidToken
 import logging
@@ -27,6 +27,11 @@ class SharedStorage:
 
         self._encryption_key = self._get_encryption_key()
 
+        # Decrypted cookies with the (mtime_ns, size) of the file they were
+        # read from. The integration may also delete the file directly, so
+        # the cache is only trusted while the file still matches.
+        self._cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+
     def _get_encryption_key(self) -> bytes:
         """Get or create encryption key."""
         if self.key_file.exists():
@@ -60,6 +65,7 @@ class SharedStorage:
             temp_file = self.storage_path.with_suffix('.tmp')
             temp_file.write_bytes(encrypted)
             temp_file.rename(self.storage_path)
+            self._cache = None
 
             os.chmod(self.storage_path, 0o600)
 
@@ -71,9 +77,16 @@ class SharedStorage:
 
     async def load_cookies(self) -> List[Dict[str, Any]]:
         """Load cookies from encrypted file."""
-        if not self.storage_path.exists():
+        try:
+            stat = self.storage_path.stat()
+        except FileNotFoundError:
+            self._cache = None
             raise FileNotFoundError("No cookies found")
 
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == signature:
+            return self._cache[1]
+
         try:
             # Read and decrypt
             encrypted = self.storage_path.read_bytes()
@@ -85,6 +98,7 @@ class SharedStorage:
             cookies = data.get("cookies", [])
 
             _LOGGER.info(f"Loaded {len(cookies)} cookies from shared storage")
+            self._cache = (signature, cookies)
             return cookies
 
         except InvalidToken:
@@ -101,6 +115,7 @@ class SharedStorage:
 
     async def clear_cookies(self) -> None:
         """Remove stored cookies."""
+        self._cache = None
         if self.storage_path.exists():
             self.storage_path.unlink()
             _LOGGER.info("Cleared stored cookies")